@@ -2,8 +2,8 @@ import numpy as np
 import nura.autograd.graph as graph
 import nura.autograd.forwardad as forwardad
 
-from .autograd.functional import backward, grad
-from .autograd.mode import Autograd, usegrad, nograd, setgrad, forwardmode
+from .autograd.functional import backward, grad, clearpool
+from .autograd.mode import Autograd, usegrad, nograd, setgrad, forwardmode, accumtype
 from .types import char, byte, short, int, long, half, float, double, bool, dtypeof, inf
 from .tensors import tensor
 
@@ -49,6 +49,7 @@ from .functional import (
     select,
     flatten,
     concat,
+    maskedfill,
 )
 
 from .utils import (
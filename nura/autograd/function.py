@@ -1,13 +1,15 @@
 import nura
 from nura.tensors import Tensor
 from numpy import ndarray
-from typing import Tuple, Any, Optional, Union
+from typing import Tuple, Any, Optional, Union, Dict
 
 
 class Context:
 
-    def __init__(self) -> None:
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
         self._context: Optional[Tuple[Tuple[Tensor, int], ...]] = None
+        self._args = args
+        self._kwargs = kwargs
 
     def save(self, *tensors: Tensor) -> None:
         self._context = tuple((t, t.version) for t in tensors)
@@ -21,6 +23,9 @@ class Context:
             )
         return tuple(t for t, _ in self._context)
 
+    def arguments(self) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        return self._args, self._kwargs
+
     def usesgrad(self) -> bool:
         if self._context is None:
             return False
@@ -40,6 +45,9 @@ class Context:
 
 class Function:
 
+    batched = False
+    recompute = False
+
     @staticmethod
     def forward(context: Context, *args: Any, **kwargs: Any) -> ndarray:
         raise NotImplementedError
@@ -56,14 +64,12 @@ class Function:
 
     @classmethod
     def apply(cls, *args: Any, **kwargs: Any) -> Any:
-        context = Context()
+        context = Context(*args, **kwargs) if cls.recompute else Context()
         arr = cls.forward(context, *args, **kwargs)
         output = nura.tensor(arr)
-        if context.usesgrad():
-            if nura.Autograd.forwardmode():
-                nura.forwardad.primalify(output, cls, context)
-            elif nura.Autograd.reversemode():
-                nura.graph.addtograph(output, cls, context)
+        recorder = nura.Autograd.recorder()
+        if recorder is not None and context.usesgrad():
+            recorder(output, cls, context)
         return output
 
     @classmethod
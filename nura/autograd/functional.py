@@ -2,8 +2,22 @@ import numpy as np
 import nura
 from nura.tensors import Tensor
 from nura.autograd.graph import Node, toposort
-from typing import Any, Dict, Generator, Tuple, Optional, Callable, Union, Set
 from collections import deque
+from threading import local
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Optional,
+    Callable,
+    Union,
+    Set,
+    Sequence,
+)
+
+_pool = local()
+_poolbytes = 1 << 28
 
 
 def backward(
@@ -50,28 +64,34 @@ def _backward(
     output: Tuple[Tensor, ...], grad: Tuple[Tensor, ...], input: Tuple[Tensor, ...]
 ) -> None:
 
-    nodes = tuple(o.gradfn for o in output if o.gradfn is not None)
-    topotuple = toposort(nodes)
-    retain = _getretain(topotuple, input)
-    gradmap = _getgradmap(nodes, output, grad)
-    queue = deque(topotuple)
-
-    while queue:
-        node = queue.popleft()
-        nodegrad = gradmap[node]
-        if node in retain:
-            _accumulate(node, nodegrad)
-        if node.edges:
-            gradoutput = _tupify(node.apply(nodegrad))
-            for edge, edgegrad in zip(node.edges, gradoutput):
-                if edge is None:
-                    continue
-                if edge not in gradmap:
-                    gradmap[edge] = nura.zeroslike(edge.output)
-                if _mismatch(edge.output, edgegrad):
-                    edgegrad = _sumgrad(edge.output, edgegrad)
-                gradmap[edge] += edgegrad
-        gradmap.pop(node)
+    with nura.nograd():
+        nodes = tuple(o.gradfn for o in output if o.gradfn is not None)
+        index, order, edges, offsets, pending = _indexgraph(nodes)
+        retain = _getretain(order, input)
+        grads = _getgrads(index, nodes, output, grad)
+        ready = deque(index[n] for n in nodes if not pending[index[n]])
+        roots = len(set(nodes))
+
+        while ready:
+            nid = ready.popleft()
+            node = order[nid]
+            nodegrad = grads[nid]
+            grads[nid] = None
+            adopted = False
+            if node in retain:
+                adopted = _accumulate(node, nodegrad, nid >= roots)
+            start, end = offsets[nid], offsets[nid + 1]
+            if start < end:
+                gradoutput = _tupify(node.apply(nodegrad))
+                for eid, edgegrad in zip(edges[start:end], gradoutput):
+                    if eid < 0:
+                        continue
+                    _addgrad(grads, eid, order[eid], edgegrad)
+                    pending[eid] -= 1
+                    if not pending[eid]:
+                        ready.append(eid)
+            if nid >= roots and not adopted:
+                _release(nodegrad)
 
 
 def grad(
@@ -109,33 +129,41 @@ def grad(
 
 
 def _grad(
-    input: Tuple[Tensor, ...], output: Tuple[Tensor, ...], grad: Tuple[Tensor, ...]
+    input: Tuple[Tensor, ...],
+    output: Tuple[Tensor, ...],
+    grad: Tuple[Tensor, ...],
+    batch: Optional[int] = None,
 ) -> Tuple[Tensor, ...]:
-    nodes = tuple(o.gradfn for o in output if o.gradfn is not None)
-    topotuple = toposort(nodes)
-    retain = _getretain((), input)
-    gradmap = _getgradmap(nodes, output, grad)
-    queue = deque(topotuple)
-
-    while queue:
-        node = queue.popleft()
-        nodegrad = gradmap[node]
-        if node.edges:
-            gradoutput = _tupify(node.apply(nodegrad))
-            for edge, edgegrad in zip(node.edges, gradoutput):
-                if edge is None:
-                    continue
-                if edge not in gradmap:
-                    gradmap[edge] = nura.zeroslike(edge.output)
-                if _mismatch(edge.output, edgegrad):
-                    edgegrad = _sumgrad(edge.output, edgegrad)
-                gradmap[edge] += edgegrad
-        if node not in retain:
-            gradmap.pop(node)
-    return tuple(gradmap[i.gradfn] for i in input if i.gradfn is not None)
-
-
-def _getretain(node: Tuple[Node, ...], input: Tuple[Tensor, ...]) -> Set[Node]:
+    with nura.nograd():
+        nodes = tuple(o.gradfn for o in output if o.gradfn is not None)
+        index, order, edges, offsets, pending = _indexgraph(nodes)
+        retain = _getretain((), input)
+        grads = _getgrads(index, nodes, output, grad)
+        ready = deque(index[n] for n in nodes if not pending[index[n]])
+        roots = len(set(nodes))
+
+        while ready:
+            nid = ready.popleft()
+            node = order[nid]
+            nodegrad = grads[nid]
+            if node not in retain:
+                grads[nid] = None
+            start, end = offsets[nid], offsets[nid + 1]
+            if start < end:
+                gradoutput = _tupify(node.apply(nodegrad))
+                for eid, edgegrad in zip(edges[start:end], gradoutput):
+                    if eid < 0:
+                        continue
+                    _addgrad(grads, eid, order[eid], edgegrad, batch)
+                    pending[eid] -= 1
+                    if not pending[eid]:
+                        ready.append(eid)
+            if nid >= roots and node not in retain:
+                _release(nodegrad)
+        return tuple(grads[index[i.gradfn]] for i in input if i.gradfn is not None)
+
+
+def _getretain(node: Sequence[Node], input: Tuple[Tensor, ...]) -> Set[Node]:
     retain = set()
     for n in node:
         if n.accumulate:
@@ -146,16 +174,92 @@ def _getretain(node: Tuple[Node, ...], input: Tuple[Tensor, ...]) -> Set[Node]:
     return retain
 
 
-def _getgradmap(
-    node: Tuple[Node, ...], output: Tuple[Tensor, ...], grad: Tuple[Tensor, ...]
-) -> Dict[Node, Tensor]:
-    gradmap = {}
+def _indexgraph(
+    nodes: Tuple[Node, ...],
+) -> Tuple[Dict[Node, int], List[Node], List[int], List[int], List[int]]:
+    index = dict.fromkeys(nodes, 0)
+    order = list(index)
+    for i, n in enumerate(order):
+        index[n] = i
+    edges, offsets, pending = [], [0], [0] * len(order)
+    nid = 0
+    while nid < len(order):
+        for e in order[nid].edges:
+            if e is None:
+                edges.append(-1)
+                continue
+            if e not in index:
+                index[e] = len(order)
+                order.append(e)
+                pending.append(0)
+            eid = index[e]
+            pending[eid] += 1
+            edges.append(eid)
+        offsets.append(len(edges))
+        nid += 1
+    return index, order, edges, offsets, pending
+
+
+def _getgrads(
+    index: Dict[Node, int],
+    node: Tuple[Node, ...],
+    output: Tuple[Tensor, ...],
+    grad: Tuple[Tensor, ...],
+) -> List[Optional[Tensor]]:
+    grads: List[Optional[Tensor]] = [None] * len(index)
     for i, (n, o) in enumerate(zip(node, output)):
         if i < len(grad):
-            gradmap[n] = grad[i]
+            grads[index[n]] = grad[i]
         else:
-            gradmap[n] = nura.oneslike(o)
-    return gradmap
+            grads[index[n]] = nura.oneslike(o)
+    return grads
+
+
+def _addgrad(
+    grads: List[Optional[Tensor]],
+    eid: int,
+    edge: Node,
+    edgegrad: Tensor,
+    batch: Optional[int] = None,
+) -> None:
+    dim = edge.output.dim if batch is None else (batch,) + edge.output.dim
+    if dim != edgegrad.dim:
+        edgegrad = _sumgrad(dim, edgegrad, batch is not None)
+    if grads[eid] is None:
+        arr = _checkout(dim, edge.output.data.dtype)
+        np.copyto(arr, edgegrad.data)
+        grads[eid] = nura.tensor(arr, dtype=edge.output.dtype)
+    else:
+        np.add(grads[eid].data, edgegrad.data, out=grads[eid].data)
+
+
+def clearpool() -> None:
+    _pool.buffers = {}
+    _pool.nbytes = 0
+
+
+def _buffers() -> Dict[Tuple[Tuple[int, ...], np.dtype], List[np.ndarray]]:
+    if getattr(_pool, "buffers", None) is None:
+        clearpool()
+    return _pool.buffers
+
+
+def _checkout(dim: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    arrs = _buffers().get((dim, dtype))
+    if arrs:
+        arr = arrs.pop()
+        _pool.nbytes -= arr.nbytes
+        return arr
+    return np.empty(dim, dtype=dtype)
+
+
+def _release(grad: Tensor) -> None:
+    arr = grad.data
+    buffers = _buffers()
+    if _pool.nbytes + arr.nbytes > _poolbytes:
+        return
+    buffers.setdefault((arr.shape, arr.dtype), []).append(arr)
+    _pool.nbytes += arr.nbytes
 
 
 def _tupify(input: Optional[Union[Tuple[Tensor, ...], Tensor]]) -> Tuple[Tensor, ...]:
@@ -166,25 +270,20 @@ def _tupify(input: Optional[Union[Tuple[Tensor, ...], Tensor]]) -> Tuple[Tensor,
     return input
 
 
-def _mismatch(tensor: Tensor, grad: Tensor) -> bool:
-    return tensor.dim != grad.dim
-
-
-def _sumgrad(tensor: Tensor, grad: Tensor) -> Tensor:
-    if tensor.ndim <= grad.ndim:
-        pad = np.pad(tensor.dim, (grad.ndim - tensor.ndim, 0), constant_values=0)
-        mismatched = pad != grad.dim
-        dim = np.nonzero(mismatched)[0]
-        grad = grad.sum(dim=tuple(dim), keepdims=True)
-        if tensor.ndim < grad.ndim:
-            dim = tuple(range(grad.ndim - tensor.ndim))
-            grad = grad.squeeze(dim)
+def _sumgrad(dim: Tuple[int, ...], grad: Tensor, batched: bool = False) -> Tensor:
+    if len(dim) <= grad.ndim:
+        lead, extra = int(batched), grad.ndim - len(dim)
+        pad = np.array(dim[:lead] + (0,) * extra + dim[lead:])
+        mismatched = np.nonzero(pad != grad.dim)[0]
+        grad = grad.sum(dim=tuple(mismatched), keepdims=True)
+        if extra:
+            grad = grad.squeeze(tuple(range(lead, lead + extra)))
     else:
-        grad = nura.zeroslike(tensor) + grad
+        grad = nura.zeros(dim, dtype=grad.dtype) + grad
     return grad
 
 
-def _accumulate(node: Node, grad: Tensor) -> None:
+def _accumulate(node: Node, grad: Tensor, owned: bool = False) -> bool:
     if node.output.dim != grad.dim:
         raise ValueError(
             f"Cannot accumulate gradient, node output dimensions does not match gradient dimensions ({node.output.dim} != {grad.dim})"
@@ -193,9 +292,20 @@ def _accumulate(node: Node, grad: Tensor) -> None:
         raise ValueError(
             f"Cannot accumulate gradient, node output type does not match gradient type ({node.output.dtype.name()} != {grad.dtype.name()})"
         )
+    accumtype = nura.Autograd.accumtype() or node.output.dtype
+    adopted = False
     if node.output._grad is None:
-        node.output._grad = nura.zeroslike(node.output)
-    node.output._grad += grad
+        adopted = owned and grad.dtype is accumtype
+        arr = grad.data if adopted else grad.data.astype(accumtype._wrapping)
+        node.output._grad = nura.tensor(arr, dtype=accumtype)
+    else:
+        if node.output._grad.dtype is not accumtype:
+            node.output._grad = node.output._grad.to(accumtype)
+        np.add(node.output._grad.data, grad.data, out=node.output._grad.data)
+    if node.output.accumhook is not None:
+        node.output.accumhook(node.output)
+        node.output._grad = None
+    return adopted
 
 
 def vjp(
@@ -305,8 +415,13 @@ def jacrev(
     jac = _getjac(tensor, output)
     perts = _getperts(output)
 
-    for row, pert in zip(np.ndindex(output.dim), perts):
-        _, vjps = _vjp(input, pert, func, *args, **kwargs)
+    if _batchable(output):
+        vjps = _grad(input, (output,), (perts,), output.nelem)
+        jac[...] = vjps[pos].reshape(jac.dim)
+        return output, jac
+
+    for i, row in enumerate(np.ndindex(output.dim)):
+        vjps = _grad(input, (output,), (perts[i],))
         jacrow = vjps[pos]
         slc = row + (...,)
         jac[slc] = jacrow
@@ -341,22 +456,25 @@ def jacfwd(
         for i, t in enumerate(input)
     ]
 
-    for col, pert in zip(np.ndindex(tensor.dim), perts):
-        colinput[pos] = colinput[pos].mutated(usegrad=True, grad=pert)
+    for i, col in enumerate(np.ndindex(tensor.dim)):
+        colinput[pos] = colinput[pos].mutated(usegrad=True, grad=perts[i])
         _, jaccol = _jvp(tuple(colinput), func, *args, **kwargs)
         slc = (...,) + col
         jac[slc] = jaccol
     return output, jac
 
 
-def _getperts(tensor: Tensor) -> Generator[Tensor, None, None]:
+def _batchable(output: Tensor) -> bool:
+    if output.gradfn is None:
+        return False
+    nodes = toposort(output.gradfn)
+    return all(n.function is None or n.function.batched for n in nodes)
+
+
+def _getperts(tensor: Tensor) -> Tensor:
     nelem, dim, dtype = tensor.nelem, tensor.dim, tensor.dtype
-    perts = nura.zeros((nelem,) + dim).to(dtype)
-    arange = np.arange(nelem)
-    indices = np.unravel_index(arange, dim)
-    slc = (arange,) + indices
-    perts[slc] = 1.0
-    return (perts[i] for i in range(nelem))
+    perts = nura.eye(nelem, dtype=dtype).reshape((nelem,) + dim)
+    return perts
 
 
 def _getjac(tensor: Tensor, output: Tensor) -> Tensor:
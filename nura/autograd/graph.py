@@ -20,6 +20,7 @@ class Node:
         self._context = context
         self._edges = edges
         self._accumulate = accumulate
+        self._recompute = False
 
     @property
     def output(self) -> Tensor:
@@ -43,16 +44,37 @@ class Node:
     def accumulate(self) -> bool:
         return self._accumulate and self.output.usegrad
 
+    @property
+    def recomputes(self) -> bool:
+        return self._recompute
+
     def retain(self) -> None:
         self._accumulate = True
 
     def unretain(self) -> None:
         self._accumulate = False
 
+    def rematerialize(self) -> None:
+        if self.function is None or not self.function.recompute:
+            raise RuntimeError(
+                "Cannot rematerialize node, function does not support recomputation"
+            )
+        self._recompute = True
+
+    def recompute(self) -> Context:
+        if self.function is None or self.context is None:
+            raise RuntimeError("Cannot recompute, function and/or context is None")
+        self.context.tensors()
+        args, kwargs = self.context.arguments()
+        context = Context(*args, **kwargs)
+        self.function.forward(context, *args, **kwargs)
+        return context
+
     def apply(self, grad: Tensor) -> Union[Tuple[Tensor, ...], Tensor]:
         if self.function is None or self.context is None:
             raise RuntimeError("Cannot apply backward, function and/or context is None")
-        arr = self.function.backward(self.context, grad)
+        context = self.recompute() if self._recompute else self.context
+        arr = self.function.backward(context, grad)
         return nura.totensor(arr)
 
     def name(self) -> str:
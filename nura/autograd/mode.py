@@ -1,12 +1,37 @@
 import nura
+import nura.types as types
+from nura.types import dtype
 from nura.tensors import Tensor
+from nura.autograd.graph import addtograph
+from nura.autograd.forwardad import primalify
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, Optional, Callable, Type
 
 
 class Autograd:
     _usegrad = True
     _forwardmode = False
+    _recorder: Optional[Callable] = addtograph
+    _accumtype: Optional[Type[dtype]] = None
+
+    @classmethod
+    def recorder(cls) -> Optional[Callable]:
+        return cls._recorder
+
+    @classmethod
+    def accumtype(cls) -> Optional[Type[dtype]]:
+        return cls._accumtype
+
+    @classmethod
+    def setmode(cls, usegrad: bool, forwardmode: bool) -> None:
+        cls._usegrad = usegrad
+        cls._forwardmode = forwardmode
+        if cls.forwardmode():
+            cls._recorder = primalify
+        elif cls.reversemode():
+            cls._recorder = addtograph
+        else:
+            cls._recorder = None
 
     @classmethod
     def reversemode(cls) -> bool:
@@ -21,46 +46,55 @@ class Autograd:
 def usegrad() -> Generator:
     usegrad = Autograd._usegrad
     forwardmode = Autograd._forwardmode
-    Autograd._usegrad = True
-    Autograd._forwardmode = False
+    Autograd.setmode(True, False)
     try:
         yield
     finally:
-        Autograd._usegrad = usegrad
-        Autograd._forwardmode = forwardmode
+        Autograd.setmode(usegrad, forwardmode)
 
 
 @contextmanager
 def nograd() -> Generator:
     usegrad = Autograd._usegrad
-    Autograd._usegrad = False
+    forwardmode = Autograd._forwardmode
+    Autograd.setmode(False, forwardmode)
     try:
         yield
     finally:
-        Autograd._usegrad = usegrad
+        Autograd.setmode(usegrad, forwardmode)
 
 
 @contextmanager
 def setgrad(state: bool) -> Generator:
     usegrad = Autograd._usegrad
     forwardmode = Autograd._forwardmode
-    Autograd._usegrad = state
-    Autograd._forwardmode = not state
+    Autograd.setmode(state, not state)
     try:
         yield
     finally:
-        Autograd._usegrad = usegrad
-        Autograd._forwardmode = forwardmode
+        Autograd.setmode(usegrad, forwardmode)
 
 
 @contextmanager
 def forwardmode() -> Generator:
     usegrad = Autograd._usegrad
     forwardmode = Autograd._forwardmode
-    Autograd._usegrad = False
-    Autograd._forwardmode = True
+    Autograd.setmode(False, True)
+    try:
+        yield
+    finally:
+        Autograd.setmode(usegrad, forwardmode)
+
+
+@contextmanager
+def accumtype(dtype: Optional[Type[dtype]]) -> Generator:
+    if dtype is not None and dtype not in (types.half, types.float, types.double):
+        raise ValueError(
+            f"Cannot accumulate gradients as {dtype.name()}, only floating-point types can"
+        )
+    accumtype = Autograd._accumtype
+    Autograd._accumtype = dtype
     try:
         yield
     finally:
-        Autograd._usegrad = usegrad
-        Autograd._forwardmode = forwardmode
+        Autograd._accumtype = accumtype
@@ -0,0 +1,51 @@
+import numpy as np
+from nura.tensors import Tensor
+from nura.autograd.graph import Node, toposort
+from typing import List, Tuple
+
+
+def plan(output: Tensor, minbytes: int = 0) -> Tuple[Node, ...]:
+    if output.gradfn is None:
+        return ()
+    nodes = toposort(output.gradfn)
+    return tuple(
+        n
+        for n in nodes
+        if n.function is not None
+        and n.function.recompute
+        and not n.recomputes
+        and savedbytes(n) > minbytes
+    )
+
+
+def rematerialize(output: Tensor, minbytes: int = 0) -> int:
+    freed = 0
+    for node in plan(output, minbytes):
+        for name, arr in _saved(node):
+            del node.context.__dict__[name]
+            freed += arr.nbytes
+        node.rematerialize()
+    return freed
+
+
+def savedbytes(node: Node) -> int:
+    return sum(arr.nbytes for _, arr in _saved(node))
+
+
+def _saved(node: Node) -> List[Tuple[str, np.ndarray]]:
+    if node.context is None:
+        return []
+    args, kwargs = node.context.arguments()
+    shared = [t.data for t in node.context.tensors()]
+    shared.append(node.output.data)
+    for arg in (*args, *kwargs.values()):
+        if isinstance(arg, Tensor):
+            shared.append(arg.data)
+        elif isinstance(arg, np.ndarray):
+            shared.append(arg)
+    return [
+        (name, value)
+        for name, value in vars(node.context).items()
+        if isinstance(value, np.ndarray)
+        and not any(np.may_share_memory(value, s) for s in shared)
+    ]
@@ -207,6 +207,8 @@ def std(
 
 
 def transpose(a: Tensor, dim0: int = -2, dim1: int = -1) -> Tensor:
+    if not a.usegrad:
+        return tensor(a.data.swapaxes(dim0, dim1))
     out = functions.Transpose.apply(a, dim0, dim1)
     return out
 
@@ -289,3 +291,8 @@ def concat(a: Tensor, b: Tensor, dim: int = 0) -> Tensor:
             "Cannot concatenate Tensors, they differ for more than one dimension"
         )
     return functions.Concat.apply(a, b, dim)
+
+
+def maskedfill(a: Tensor, mask: Tensor, value: Scalar) -> Tensor:
+    out = functions.MaskedFill.apply(a, mask, value)
+    return out
@@ -9,6 +9,8 @@ np._set_promotion_state("weak")
 
 class Add(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor, b: Tensor):
         context.save(a, b)
@@ -17,7 +19,7 @@ class Add(Function):
 
     @staticmethod
     def backward(context: Context, grad: Tensor):
-        return grad.data.copy(), grad.data.copy()
+        return grad.data, grad.data
 
     @staticmethod
     def tangent(context: Context, agrad: Tensor, bgrad: Tensor):
@@ -27,6 +29,8 @@ class Add(Function):
 
 class Sub(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor, b: Tensor):
         context.save(a, b)
@@ -35,16 +39,18 @@ class Sub(Function):
 
     @staticmethod
     def backward(context: Any, grad: Tensor):
-        return grad.data.copy(), np.negative(grad.data)
+        return grad.data, np.negative(grad.data)
 
     @staticmethod
     def tangent(context: Context, agrad: Tensor, bgrad: Tensor):
-        arr = agrad.data + np.negative(bgrad.data)
+        arr = np.subtract(agrad.data, bgrad.data)
         return arr
 
 
 class Mul(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor, b: Tensor):
         context.save(a, b)
@@ -61,31 +67,38 @@ class Mul(Function):
     @staticmethod
     def tangent(context: Context, agrad: Tensor, bgrad: Tensor):
         a, b = context.tensors()
-        arr = agrad.data * b.data + bgrad.data * a.data
+        arr = np.multiply(agrad.data, b.data)
+        arr += bgrad.data * a.data
         return arr
 
 
 class Div(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor, b: Tensor):
         context.save(a, b)
-        arr = a.data * (1 / b.data)
+        arr = np.divide(a.data, b.data)
         return arr
 
     @staticmethod
     def backward(context: Context, grad: Tensor):
         a, b = context.tensors()
-        arr0 = grad.data * (1 / b.data)
-        arr1 = np.negative(a.data) * (1 / np.square(b.data)) * grad.data
+        arr0 = np.divide(grad.data, b.data)
+        arr1 = np.multiply(arr0, a.data)
+        arr1 /= b.data
+        arr1 *= -1
         return arr0, arr1
 
     @staticmethod
     def tangent(context: Context, agrad: Tensor, bgrad: Tensor):
         a, b = context.tensors()
-        arr0 = agrad.data * (1 / b.data)
-        arr1 = a.data * np.negative(1 / np.square(b.data)) * bgrad.data
-        arr = arr0 + arr1
+        arr = np.multiply(bgrad.data, a.data)
+        arr /= b.data
+        arr *= -1
+        arr += agrad.data
+        arr /= b.data
         return arr
 
 
@@ -131,22 +144,31 @@ class Dot(Function):
 
 class Matmul(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor, b: Tensor):
         context.save(a, b)
+        if a.ndim > 2 and b.ndim == 2:
+            arr = np.matmul(a.data.reshape(-1, a.dim[-1]), b.data)
+            return arr.reshape(a.dim[:-1] + b.dim[-1:])
         return np.matmul(a.data, b.data)
 
     @staticmethod
     def backward(context: Context, grad: Tensor):
         a, b = context.tensors()
         if a.ndim == 1:
-            axis = tuple(range(b.ndim - 2)) + (b.ndim - 1,)
+            axis = tuple(range(-b.ndim, -2)) + (-1,)
             arr0 = (b.data * np.expand_dims(grad.data, -2)).sum(axis=axis)
             arr1 = np.einsum("...jl,k->...jkl", grad.data, a.data)
         elif b.ndim == 1:
-            axis = tuple(range(a.ndim - 1))
+            axis = tuple(range(-a.ndim, -1))
             arr0 = np.einsum("...,l->...l", grad.data, b.data)
             arr1 = (a.data * np.expand_dims(grad.data, -1)).sum(axis=axis)
+        elif a.ndim > 2 and b.ndim == 2 and grad.ndim == a.ndim:
+            arr = grad.data.reshape(-1, b.dim[-1])
+            arr0 = np.matmul(arr, b.data.T).reshape(a.dim)
+            arr1 = np.matmul(a.data.reshape(-1, a.dim[-1]).T, arr)
         else:
             arr1 = np.matmul(a.data.swapaxes(-2, -1), grad.data)
             arr0 = np.matmul(grad.data, b.data.swapaxes(-2, -1))
@@ -163,6 +185,8 @@ class Matmul(Function):
 
 class Pow(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor, b: Tensor):
         arr = np.power(a.data, b.data)
@@ -189,6 +213,8 @@ class Pow(Function):
 
 class Exp(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor):
         arr = np.exp(a.data)
@@ -209,6 +235,8 @@ class Exp(Function):
 
 class Log(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor):
         context.save(a)
@@ -218,18 +246,20 @@ class Log(Function):
     @staticmethod
     def backward(context: Context, grad: Tensor):
         a = context.tensors()[0]
-        arr = (1 / a.data) * grad.data
+        arr = np.divide(grad.data, a.data)
         return arr
 
     @staticmethod
     def tangent(context: Context, grad: Tensor):
         a = context.tensors()[0]
-        arr = (1 / a.data) * grad.data
+        arr = np.divide(grad.data, a.data)
         return arr
 
 
 class Sin(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor):
         context.save(a)
@@ -251,6 +281,8 @@ class Sin(Function):
 
 class Cos(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor):
         context.save(a)
@@ -260,13 +292,15 @@ class Cos(Function):
     @staticmethod
     def backward(context: Context, grad: Tensor):
         a = context.tensors()[0]
-        arr = grad.data * np.negative(np.sin(a.data))
+        arr = np.multiply(grad.data, np.sin(a.data))
+        arr *= -1
         return arr
 
     @staticmethod
     def tangent(context: Context, grad: Tensor):
         a = context.tensors()[0]
-        arr = grad.data * np.negative(np.sin(a.data))
+        arr = np.multiply(grad.data, np.sin(a.data))
+        arr *= -1
         return arr
 
 
@@ -393,6 +427,8 @@ class Mean(Function):
 
 class Var(Function):
 
+    recompute = True
+
     @staticmethod
     def forward(
         context: Context, a: Tensor, correction: int, dim: dimlike, keepdims: bool
@@ -492,12 +528,14 @@ class Reshape(Function):
 
 class Transpose(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor, dim0: int, dim1: int):
         arr = a.data.swapaxes(dim0, dim1)
         context.save(a)
-        context.dim0 = dim0
-        context.dim1 = dim1
+        context.dim0 = dim0 - a.ndim if dim0 >= 0 else dim0
+        context.dim1 = dim1 - a.ndim if dim1 >= 0 else dim1
         return arr
 
     @staticmethod
@@ -542,6 +580,8 @@ class Permute(Function):
 
 class Abs(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor):
         context.save(a)
@@ -562,6 +602,8 @@ class Abs(Function):
 
 class Pos(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor):
         context.save(a)
@@ -578,6 +620,8 @@ class Pos(Function):
 
 class Neg(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor):
         context.save(a)
@@ -596,6 +640,8 @@ class Neg(Function):
 
 class Clone(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, a: Tensor):
         context.save(a)
@@ -681,3 +727,31 @@ class Concat(Function):
     def tangent(context: Context, agrad: Tensor, bgrad: Tensor):
         dim = context.dim
         return np.concatenate((agrad.data, bgrad.data), axis=dim)
+
+
+class MaskedFill(Function):
+
+    batched = True
+
+    @staticmethod
+    def forward(context: Context, a: Tensor, mask: Tensor, value: float):
+        context.save(a)
+        mask = mask.data.astype(bool, copy=False)
+        context.mask = mask
+        arr = a.data.copy()
+        np.copyto(arr, value, where=mask)
+        return arr
+
+    @staticmethod
+    def backward(context: Context, grad: Tensor):
+        mask = context.mask
+        arr = grad.data.copy()
+        np.copyto(arr, 0, where=mask)
+        return arr
+
+    @staticmethod
+    def tangent(context: Context, grad: Tensor):
+        mask = context.mask
+        arr = grad.data.copy()
+        np.copyto(arr, 0, where=mask)
+        return arr
@@ -1,18 +1,32 @@
 import nura
 import nura.nn.functions as functions
-import nura.utils as utils
 from nura.types import dimlike
 from nura.tensors import Tensor
 from typing import Optional, Tuple
 
 
 def linear(x: Tensor, w: Tensor, b: Optional[Tensor] = None) -> Tensor:
-    out = nura.matmul(x, w.transpose())
+    if w.ndim == 2 and x.ndim > 0:
+        if b is not None and b.dim == w.dim[:1]:
+            return functions.Linear.apply(x, w, b)
+        out = functions.Linear.apply(x, w)
+    else:
+        out = nura.matmul(x, w.transpose())
     if b is not None:
         out = out + b
     return out
 
 
+def qlinear(
+    x: Tensor, w: Tensor, scale: Tensor, b: Optional[Tensor] = None
+) -> Tensor:
+    if w.ndim != 2 or scale.dim != w.dim[:1]:
+        raise ValueError(
+            f"Expected 2D weight with one scale per row, received {w.dim} and {scale.dim}"
+        )
+    return functions.QLinear.apply(x, w, scale, b)
+
+
 def sigmoid(x: Tensor) -> Tensor:
     out = functions.Sigmoid.apply(x)
     return out
@@ -65,18 +79,33 @@ def attention(
     mask: Optional[Tensor] = None,
     maskfill: float = -1e9,
     drop: Optional[float] = None,
+    scale: Optional[float] = None,
 ) -> Tuple[Tensor, Tensor]:
-    norm = 1 / (k.dim[-1] ** 0.5)
-    simscore = nura.matmul(q, k.transpose(-1, -2)) * norm
-    if mask is not None:
-        simscore = utils.where(mask, simscore, maskfill)
-    attn = softmax(simscore, -1)
+    if scale is None:
+        scale = 1 / (k.dim[-1] ** 0.5)
+    attn = functions.AttentionWeights.apply(q, k, mask, maskfill, scale)
     if drop is not None:
         attn = dropout(attn, drop)
     context = nura.matmul(attn, v)
     return context, attn
 
 
+def flashattention(
+    q: Tensor,
+    k: Tensor,
+    v: Tensor,
+    mask: Optional[Tensor] = None,
+    maskfill: float = -1e9,
+    blocksize: int = 64,
+    scale: Optional[float] = None,
+) -> Tensor:
+    if blocksize < 1:
+        raise ValueError(f"'blocksize' must be positive, received {blocksize}")
+    if scale is None:
+        scale = 1 / (k.dim[-1] ** 0.5)
+    return functions.FlashAttention.apply(q, k, v, mask, maskfill, blocksize, scale)
+
+
 def embedding(x: Tensor, w: Tensor, padid: Optional[int] = None) -> Tensor:
     return functions.Embedding.apply(x, w, padid)
 
@@ -8,28 +8,117 @@ from typing import Optional
 np._set_promotion_state("weak")
 
 
+class Linear(Function):
+
+    @staticmethod
+    def forward(context: Context, x: Tensor, w: Tensor, b: Optional[Tensor] = None):
+        if b is None:
+            context.save(x, w)
+        else:
+            context.save(x, w, b)
+        arr = np.matmul(x.data.reshape(-1, w.dim[-1]), w.data.T)
+        if b is not None:
+            arr += b.data
+        return arr.reshape(x.dim[:-1] + w.dim[:1])
+
+    @staticmethod
+    def backward(context: Context, grad: Tensor):
+        x, w, *b = context.tensors()
+        arr = grad.data.reshape(-1, w.dim[0])
+        arr0 = np.matmul(arr, w.data).reshape(x.dim)
+        arr1 = np.matmul(arr.T, x.data.reshape(-1, w.dim[-1]))
+        if not b:
+            return arr0, arr1
+        arr2 = arr.sum(axis=0)
+        return arr0, arr1, arr2
+
+    @staticmethod
+    def tangent(context: Context, xgrad: Tensor, wgrad: Tensor, *bgrad: Tensor):
+        x, w, *_ = context.tensors()
+        arr = np.matmul(xgrad.data, w.data.T)
+        arr += np.matmul(x.data, wgrad.data.T)
+        if bgrad:
+            arr += bgrad[0].data
+        return arr
+
+
+class QLinear(Function):
+
+    @staticmethod
+    def forward(
+        context: Context,
+        x: Tensor,
+        w: Tensor,
+        scale: Tensor,
+        b: Optional[Tensor] = None,
+    ):
+        if b is None:
+            context.save(x)
+        else:
+            context.save(x, b)
+        context.w = w.data
+        context.scale = scale.data
+        arr = np.matmul(
+            x.data.reshape(-1, w.dim[-1]), w.data.T.astype(x.data.dtype, copy=False)
+        )
+        arr *= scale.data
+        if b is not None:
+            arr += b.data
+        return arr.reshape(x.dim[:-1] + w.dim[:1])
+
+    @staticmethod
+    def backward(context: Context, grad: Tensor):
+        x, *b = context.tensors()
+        w = context.w
+        arr = grad.data.reshape(-1, w.shape[0])
+        arr0 = np.matmul(arr * context.scale, w.astype(arr.dtype, copy=False))
+        arr0 = arr0.reshape(x.dim)
+        if not b:
+            return arr0
+        return arr0, arr.sum(axis=0)
+
+    @staticmethod
+    def tangent(context: Context, xgrad: Tensor, *bgrad: Tensor):
+        w = context.w
+        arr = np.matmul(xgrad.data, w.T.astype(xgrad.data.dtype, copy=False))
+        arr *= context.scale
+        if bgrad:
+            arr += bgrad[0].data
+        return arr
+
+
 class Sigmoid(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, x: Tensor):
         context.save(x)
-        arr = 1 / (1 + np.exp(np.negative(x.data)))
+        arr = np.exp(np.negative(x.data))
+        arr += 1
+        arr **= -1
         context.arr = arr
         return arr
 
     @staticmethod
     def backward(context: Context, grad: Tensor):
         arr = context.arr
-        return arr * (1 - arr) * grad.data
+        mask = 1 - arr
+        mask *= arr
+        return mask * grad.data
 
     @staticmethod
     def tangent(context: Context, grad: Tensor):
         arr = context.arr
-        return arr * (1 - arr) * grad.data
+        mask = 1 - arr
+        mask *= arr
+        return mask * grad.data
 
 
 class Tanh(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, x: Tensor):
         context.save(x)
@@ -40,12 +129,18 @@ class Tanh(Function):
     @staticmethod
     def backward(context: Context, grad: Tensor):
         arr = context.arr
-        return (1 - np.square(arr)) * grad.data
+        mask = np.square(arr)
+        mask *= -1
+        mask += 1
+        return mask * grad.data
 
     @staticmethod
     def tangent(context: Context, grad: Tensor):
         arr = context.arr
-        return (1 - np.square(arr)) * grad.data
+        mask = np.square(arr)
+        mask *= -1
+        mask += 1
+        return mask * grad.data
 
 
 class Softmax(Function):
@@ -53,8 +148,8 @@ class Softmax(Function):
     @staticmethod
     def forward(context: Context, x: Tensor, dim: int):
         context.save(x)
-        exp = np.exp(x.data - x.data.max(axis=dim, keepdims=True))
-        p = exp * (1 / exp.sum(axis=dim, keepdims=True))
+        p = np.exp(x.data - x.data.max(axis=dim, keepdims=True))
+        p /= p.sum(axis=dim, keepdims=True)
         context.p = p
         context.dim = dim
         return p
@@ -63,44 +158,17 @@ class Softmax(Function):
     def backward(context: Context, grad: Tensor):
         p = context.p
         dim = context.dim
-        outshape = p.shape
-
-        if p.ndim == 1:
-            diagonal = np.diagflat(p)
-            offdiagonal = np.outer(p, p)
-            gdata = grad.data
-            jac = diagonal - offdiagonal
-        else:
-            p = p.swapaxes(dim, -1).reshape(-1, p.shape[dim])
-            diagonal = np.einsum("ij,jk->ijk", p, np.eye(p.shape[dim]))
-            offdiagonal = np.einsum("ij,ik->ijk", p, p)
-            gdata = grad.data.reshape(-1, p.shape[dim], 1)
-
-        # TODO figure out backward method
-
-        jac = diagonal - offdiagonal
-        gout = np.matmul(jac, gdata)
-        return gout.reshape(outshape).swapaxes(dim, -1) if p.ndim > 1 else gout
+        arr = p * grad.data
+        arr -= p * arr.sum(axis=dim, keepdims=True)
+        return arr
 
     @staticmethod
     def tangent(context: Context, grad: Tensor):
         p = context.p
         dim = context.dim
-        outshape = p.shape
-
-        if p.ndim == 1:
-            diagonal = np.diagflat(p)
-            offdiagonal = np.outer(p, p)
-            gdata = grad.data
-        else:
-            p = p.reshape(-1, p.shape[dim])
-            diagonal = np.einsum("ij,jk->ijk", p, np.eye(p.shape[dim]))
-            offdiagonal = np.einsum("ij,ik->ijk", p, p)
-            gdata = grad.data.reshape(-1, p.shape[dim], 1)
-
-        jac = diagonal - offdiagonal
-        gout = np.matmul(jac, gdata)
-        return gout.reshape(outshape) if p.ndim > 1 else gout
+        arr = p * grad.data
+        arr -= p * arr.sum(axis=dim, keepdims=True)
+        return arr
 
 
 class LogSoftmax(Function):
@@ -121,6 +189,8 @@ class LogSoftmax(Function):
 
 class ReLU(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, x: Tensor):
         context.save(x)
@@ -129,20 +199,18 @@ class ReLU(Function):
     @staticmethod
     def backward(context: Context, grad: Tensor):
         x = context.tensors()[0]
-        dtype = x.data.dtype
-        mask = np.where(x.data > 0, np.array(1, dtype=dtype), np.array(0, dtype=dtype))
-        return mask * grad.data
+        return grad.data * (x.data > 0)
 
     @staticmethod
     def tangent(context: Context, grad: Tensor):
         x = context.tensors()[0]
-        dtype = x.data.dtype
-        mask = np.where(x.data > 0, np.array(1, dtype=dtype), np.array(0, dtype=dtype))
-        return mask * grad.data
+        return grad.data * (x.data > 0)
 
 
 class ReLU6(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, x: Tensor):
         context.save(x)
@@ -151,28 +219,22 @@ class ReLU6(Function):
     @staticmethod
     def backward(context: Context, grad: Tensor):
         x = context.tensors()[0]
-        dtype = x.data.dtype
-        mask = np.where(
-            (x.data > 0) & (x.data < 6),
-            np.array(1, dtype=dtype),
-            np.array(0, dtype=dtype),
-        )
-        return mask * grad.data
+        mask = x.data > 0
+        mask &= x.data < 6
+        return grad.data * mask
 
     @staticmethod
     def tangent(context: Context, grad: Tensor):
         x = context.tensors()[0]
-        dtype = x.data.dtype
-        mask = np.where(
-            (x.data > 0) & (x.data < 6),
-            np.array(1, dtype=dtype),
-            np.array(0, dtype=dtype),
-        )
-        return mask * grad.data
+        mask = x.data > 0
+        mask &= x.data < 6
+        return grad.data * mask
 
 
 class LeakyReLU(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, x: Tensor, alpha: float):
         context.save(x)
@@ -183,92 +245,104 @@ class LeakyReLU(Function):
     def backward(context: Context, grad: Tensor):
         x = context.tensors()[0]
         alpha = context.alpha
-        dtype = x.data.dtype
-        mask = np.where(
-            x.data > 0, np.array(1, dtype=dtype), np.array(alpha, dtype=dtype)
-        )
+        mask = (x.data > 0).astype(x.data.dtype)
+        mask *= 1 - alpha
+        mask += alpha
         return mask * grad.data
 
     @staticmethod
     def tangent(context: Context, grad: Tensor):
         x = context.tensors()[0]
         alpha = context.alpha
-        dtype = x.data.dtype
-        mask = np.where(
-            x.data > 0, np.array(1, dtype=dtype), np.array(alpha, dtype=dtype)
-        )
+        mask = (x.data > 0).astype(x.data.dtype)
+        mask *= 1 - alpha
+        mask += alpha
         return mask * grad.data
 
 
 class ELU(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, x: Tensor, alpha: float):
         context.save(x)
         context.alpha = alpha
-        return np.where(x.data > 0, x.data, alpha * (np.exp(x.data) - 1))
+        arr = np.expm1(np.minimum(x.data, 0))
+        arr *= alpha
+        arr += np.maximum(x.data, 0)
+        return arr
 
     @staticmethod
     def backward(context: Context, grad: Tensor):
         x = context.tensors()[0]
         alpha = context.alpha
-        dtype = x.data.dtype
-        mask = np.where(x.data > 0, np.array(1, dtype=dtype), alpha * np.exp(x.data))
+        mask = np.exp(np.minimum(x.data, 0))
+        mask *= alpha
+        mask += (x.data > 0) * (1 - alpha)
         return mask * grad.data
 
     @staticmethod
     def tangent(context: Context, grad: Tensor):
         x = context.tensors()[0]
         alpha = context.alpha
-        dtype = x.data.dtype
-        mask = np.where(x.data > 0, np.array(1, dtype=dtype), alpha * np.exp(x.data))
+        mask = np.exp(np.minimum(x.data, 0))
+        mask *= alpha
+        mask += (x.data > 0) * (1 - alpha)
         return mask * grad.data
 
 
 class CELU(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, x: Tensor, alpha: float):
         context.save(x)
         context.alpha = alpha
-        arr0 = np.maximum(x.data, 0)
-        arr1 = np.minimum(0, alpha * (np.exp(x.data * (1 / alpha)) - 1))
-        return arr0 + arr1
+        arr = np.expm1(np.minimum(x.data, 0) * (1 / alpha))
+        arr *= alpha
+        arr += np.maximum(x.data, 0)
+        return arr
 
     @staticmethod
     def backward(context: Context, grad: Tensor):
         x = context.tensors()[0]
         alpha = context.alpha
-        dtype = x.data.dtype
-        mask = np.where(
-            x.data >= 0, np.array(1, dtype=dtype), np.exp(x.data * (1 / alpha))
-        )
+        mask = np.exp(np.minimum(x.data, 0) * (1 / alpha))
         return mask * grad.data
 
     @staticmethod
     def tangent(context: Context, grad: Tensor):
         x = context.tensors()[0]
         alpha = context.alpha
-        dtype = x.data.dtype
-        mask = np.where(
-            x.data >= 0, np.array(1, dtype=dtype), np.exp(x.data * (1 / alpha))
-        )
+        mask = np.exp(np.minimum(x.data, 0) * (1 / alpha))
         return mask * grad.data
 
 
 class GELU(Function):
 
+    batched = True
+    recompute = True
+
     @staticmethod
     def forward(context: Context, x: Tensor):
         context.save(x)
         PICONST = 0.79788456
         CONST = 0.044715
 
-        tanh = np.tanh(PICONST * (x.data + CONST * x.data * x.data * x.data))
+        arr = np.square(x.data)
+        arr *= CONST
+        arr += 1
+        arr *= x.data
+        arr *= PICONST
+        tanh = np.tanh(arr)
         inner = tanh + 1.0
         context.tanh = tanh
         context.inner = inner
-        return 0.5 * x.data * inner
+        arr = x.data * inner
+        arr *= 0.5
+        return arr
 
     @staticmethod
     def backward(context: Context, grad: Tensor):
@@ -277,10 +351,14 @@ class GELU(Function):
         CONST = 0.044715
         tanh = context.tanh
         inner = context.inner
-        dtanh = 1 - np.square(tanh)
-        dgelu = 0.5 * (
-            inner + x.data * PICONST * dtanh * (1 + 3 * CONST * np.square(x.data))
-        )
+        dgelu = np.square(x.data)
+        dgelu *= 3 * CONST
+        dgelu += 1
+        dgelu *= x.data
+        dgelu *= PICONST
+        dgelu *= 1 - np.square(tanh)
+        dgelu += inner
+        dgelu *= 0.5
         return dgelu * grad.data
 
     @staticmethod
@@ -290,10 +368,14 @@ class GELU(Function):
         CONST = 0.044715
         tanh = context.tanh
         inner = context.inner
-        dtanh = 1 - np.square(tanh)
-        dgelu = 0.5 * (
-            inner + x.data * PICONST * dtanh * (1 + 3 * CONST * np.square(x.data))
-        )
+        dgelu = np.square(x.data)
+        dgelu *= 3 * CONST
+        dgelu += 1
+        dgelu *= x.data
+        dgelu *= PICONST
+        dgelu *= 1 - np.square(tanh)
+        dgelu += inner
+        dgelu *= 0.5
         return dgelu * grad.data
 
 
@@ -323,6 +405,8 @@ class Embedding(Function):
 
 class CrossEntropy(Function):
 
+    recompute = True
+
     @staticmethod
     def forward(
         context: Context, x: Tensor, y: Tensor, ignoreid: int, reduction: Optional[str]
@@ -413,25 +497,27 @@ class MSE(Function):
 
 class Dropout(Function):
 
+    batched = True
+
     @staticmethod
     def forward(context: Context, x: Tensor, p: float):
         context.save(x)
-        mask = np.random.binomial(1, 1 - p, size=x.data.shape).astype(x.data.dtype)
-        context.p = p
+        mask = (np.random.random(x.data.shape) >= p).astype(x.data.dtype)
+        if p < 1:
+            mask *= 1 / (1 - p)
         context.mask = mask
-        scale = 1 / (1 - p) if p < 1 else np.inf
-        return x.data * mask * scale
+        return x.data * mask
 
     @staticmethod
     def backward(context: Context, grad: Tensor):
-        p = context.p
         mask = context.mask
-        scale = 1 / (1 - p) if p < 1 else np.inf
-        return grad.data * mask * scale
+        return grad.data * mask
 
 
 class LayerNorm(Function):
 
+    recompute = True
+
     @staticmethod
     def forward(
         context: Context,
@@ -442,45 +528,33 @@ class LayerNorm(Function):
         eps: float,
     ):
         context.save(x, gamma, beta)
-        mu = x.data.mean(axis=dim, keepdims=True)
-        var = x.data.var(axis=dim, keepdims=True, ddof=0)
-        istd = 1 / np.sqrt(var + eps)
-        norm = (x.data - mu) * istd
+        norm = x.data - x.data.mean(axis=dim, keepdims=True)
+        var = np.square(norm).mean(axis=dim, keepdims=True)
+        var += eps
+        istd = 1 / np.sqrt(var)
+        norm *= istd
 
         context.dim = dim
-        context.mu = mu
         context.istd = istd
         context.norm = norm
-        return gamma.data * norm + beta.data
+        arr = gamma.data * norm
+        arr += beta.data
+        return arr
 
     @staticmethod
     def backward(context: Context, grad: Tensor):
         x, gamma, beta = context.tensors()
         dim = context.dim
-        mu = context.mu
         istd = context.istd
         norm = context.norm
-        n = (
-            x.data.shape[dim]
-            if isinstance(dim, int)
-            else np.prod([x.data.shape[d] for d in dim])
-        )
 
         dgamma = grad.data * norm
-        dbeta = grad.data.copy()
+        dbeta = grad.data
         dnorm = grad.data * gamma.data
 
-        diff = x.data - mu
-        dvar = np.sum(-0.5 * dnorm * diff * np.power(istd, 3), axis=dim, keepdims=True)
-        dmu0 = np.sum(-1 * dnorm * istd, axis=dim, keepdims=True)
-        dmu1 = (-2 / n) * dvar * np.sum(diff, axis=dim, keepdims=True)
-        dmu = dmu0 + dmu1
-
-        dx0 = dnorm * istd
-        dx1 = (2 / n) * dvar * diff
-        dx2 = (1 / n) * dmu
-        dx = dx0 + dx1 + dx2
-
+        dx = dnorm - dnorm.mean(axis=dim, keepdims=True)
+        dx -= norm * (dnorm * norm).mean(axis=dim, keepdims=True)
+        dx *= istd
         return dx, dgamma, dbeta
 
 
@@ -539,3 +613,137 @@ class BatchNorm(Function):
         dx = dx0 + dx1 + dx2
 
         return dx, dgamma, dbeta
+
+
+class AttentionWeights(Function):
+
+    @staticmethod
+    def forward(
+        context: Context,
+        q: Tensor,
+        k: Tensor,
+        mask: Optional[Tensor],
+        maskfill: float,
+        scale: float,
+    ):
+        context.save(q, k)
+        if q.dim[-1] < k.dim[-2]:
+            arr = np.matmul(q.data * scale, k.data.swapaxes(-1, -2))
+        else:
+            arr = np.matmul(q.data, k.data.swapaxes(-1, -2))
+            arr *= scale
+        maskdata = np.logical_not(mask.data) if mask is not None else None
+        if maskdata is not None:
+            np.copyto(arr, maskfill, where=maskdata)
+        arr -= arr.max(axis=-1, keepdims=True)
+        np.exp(arr, out=arr)
+        arr /= arr.sum(axis=-1, keepdims=True)
+
+        context.scale = scale
+        context.mask = maskdata
+        context.attn = arr
+        return arr
+
+    @staticmethod
+    def backward(context: Context, grad: Tensor):
+        q, k = context.tensors()
+        scale = context.scale
+        maskdata = context.mask
+        attn = context.attn
+
+        ds = attn * grad.data
+        ds -= attn * ds.sum(axis=-1, keepdims=True)
+        if maskdata is not None:
+            np.copyto(ds, 0, where=maskdata)
+        ds *= scale
+        dq = np.matmul(ds, k.data)
+        dk = np.matmul(ds.swapaxes(-1, -2), q.data)
+        return dq, dk
+
+    @staticmethod
+    def tangent(context: Context, qgrad: Tensor, kgrad: Tensor):
+        q, k = context.tensors()
+        scale = context.scale
+        maskdata = context.mask
+        attn = context.attn
+
+        ds = np.matmul(qgrad.data, k.data.swapaxes(-1, -2))
+        ds += np.matmul(q.data, kgrad.data.swapaxes(-1, -2))
+        ds *= scale
+        if maskdata is not None:
+            np.copyto(ds, 0, where=maskdata)
+        ds -= (ds * attn).sum(axis=-1, keepdims=True)
+        ds *= attn
+        return ds
+
+
+class FlashAttention(Function):
+
+    @staticmethod
+    def forward(
+        context: Context,
+        q: Tensor,
+        k: Tensor,
+        v: Tensor,
+        mask: Optional[Tensor],
+        maskfill: float,
+        blocksize: int,
+        scale: float,
+    ):
+        context.save(q, k, v)
+        klen = k.dim[-2]
+        maskdata = (
+            np.broadcast_to(mask.data, mask.dim[:-1] + (klen,))
+            if mask is not None
+            else None
+        )
+
+        out, m, l = 0, -np.inf, 0
+        for j in range(0, klen, blocksize):
+            kj = k.data[..., j : j + blocksize, :]
+            vj = v.data[..., j : j + blocksize, :]
+            s = np.matmul(q.data, kj.swapaxes(-1, -2)) * scale
+            if maskdata is not None:
+                s = np.where(maskdata[..., j : j + blocksize], s, maskfill)
+            mnew = np.maximum(m, s.max(axis=-1, keepdims=True))
+            p = np.exp(s - mnew)
+            alpha = np.exp(m - mnew)
+            l = alpha * l + p.sum(axis=-1, keepdims=True)
+            out = alpha * out + np.matmul(p, vj)
+            m = mnew
+
+        out = out / l
+        context.scale = scale
+        context.mask = maskdata
+        context.maskfill = maskfill
+        context.blocksize = blocksize
+        context.lse = m + np.log(l)
+        context.out = out
+        return out
+
+    @staticmethod
+    def backward(context: Context, grad: Tensor):
+        q, k, v = context.tensors()
+        scale = context.scale
+        maskdata = context.mask
+        maskfill = context.maskfill
+        blocksize = context.blocksize
+        lse = context.lse
+        delta = (grad.data * context.out).sum(axis=-1, keepdims=True)
+
+        dq, dk, dv = 0, [], []
+        for j in range(0, k.dim[-2], blocksize):
+            kj = k.data[..., j : j + blocksize, :]
+            vj = v.data[..., j : j + blocksize, :]
+            s = np.matmul(q.data, kj.swapaxes(-1, -2)) * scale
+            if maskdata is not None:
+                s = np.where(maskdata[..., j : j + blocksize], s, maskfill)
+            p = np.exp(s - lse)
+            dp = np.matmul(grad.data, vj.swapaxes(-1, -2))
+            ds = p * (dp - delta)
+            if maskdata is not None:
+                ds = np.where(maskdata[..., j : j + blocksize], ds, 0)
+            dq = dq + np.matmul(ds, kj) * scale
+            dk.append(np.matmul(ds.swapaxes(-1, -2), q.data) * scale)
+            dv.append(np.matmul(p.swapaxes(-1, -2), grad.data))
+        return dq, np.concatenate(dk, axis=-2), np.concatenate(dv, axis=-2)
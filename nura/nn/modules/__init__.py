@@ -1,6 +1,6 @@
 from .activations import *
 from .module import Module
-from .linear import Linear
+from .linear import Linear, QuantizedLinear
 from .embedding import Embedding
 from .multihead import MultiHeadAttention
 from .dropout import Dropout
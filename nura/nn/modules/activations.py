@@ -124,11 +124,15 @@ class Tanh(Module):
 class ScaledDotProductAttention(Module):
 
     def __init__(
-        self, maskfill: float = -1e-9, dropout: Optional[float] = None
+        self,
+        maskfill: float = -1e-9,
+        dropout: Optional[float] = None,
+        scale: Optional[float] = None,
     ) -> None:
         super().__init__()
         self._maskfill = maskfill
         self._dropout = dropout
+        self._scale = scale
 
     @property
     def maskfill(self) -> float:
@@ -138,11 +142,15 @@ class ScaledDotProductAttention(Module):
     def dropout(self) -> Optional[float]:
         return self._dropout
 
+    @property
+    def scale(self) -> Optional[float]:
+        return self._scale
+
     def forward(
         self, q: Tensor, k: Tensor, v: Tensor, mask: Optional[Tensor] = None
     ) -> Tuple[Tensor, Tensor]:
-        return f.attention(q, k, v, mask, self.maskfill, self.dropout)
+        return f.attention(q, k, v, mask, self.maskfill, self.dropout, self.scale)
 
     def xrepr(self) -> str:
-        maskfill, dropout = self.maskfill, self.dropout
-        return f"{self.name()}({maskfill=:.1e} {dropout=})"
+        maskfill, dropout, scale = self.maskfill, self.dropout, self.scale
+        return f"{self.name()}({maskfill=:.1e} {dropout=} {scale=})"
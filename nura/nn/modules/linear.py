@@ -3,7 +3,7 @@ import nura.nn.functional as f
 import nura.utils as utils
 from nura.nn.modules.module import Module
 from nura.nn.parameter import Parameter, parameter
-from nura.nn.utils import he
+from nura.nn.utils import he, quantize
 from nura.tensors import Tensor
 from nura.types import dtype
 from typing import Type, Optional, Callable
@@ -59,8 +59,64 @@ class Linear(Module):
     def forward(self, x: Tensor) -> Tensor:
         return f.linear(x, self.weight, self.bias)
 
+    def quantize(self) -> "QuantizedLinear":
+        return QuantizedLinear(self)
+
+    def to(self, dtype: Type[types.dtype]) -> Module:
+        mod = super().to(dtype)
+        mod._dtype = dtype
+        return mod
+
+    def xrepr(self) -> str:
+        inputdim, outputdim = self.inputdim, self.outputdim
+        bias = True if self.bias is not None else False
+        dtype = self.dtype.name()
+        return f"{self.name()}({inputdim=} {outputdim=} {bias=} {dtype=})"
+
+
+class QuantizedLinear(Module):
+
+    def __init__(self, linear: Linear) -> None:
+        super().__init__()
+        self._inputdim = linear.inputdim
+        self._outputdim = linear.outputdim
+        self._dtype = linear.dtype
+        self._weight, self._scale = quantize(linear.weight)
+        self._bias = (
+            parameter(linear.bias.detach().clone()) if linear.bias is not None else None
+        )
+
+    @property
+    def weight(self) -> Tensor:
+        return self._weight
+
+    @property
+    def scale(self) -> Tensor:
+        return self._scale
+
+    @property
+    def bias(self) -> Optional[Parameter]:
+        return self._bias
+
+    @property
+    def inputdim(self) -> int:
+        return self._inputdim
+
+    @property
+    def outputdim(self) -> int:
+        return self._outputdim
+
+    @property
+    def dtype(self) -> Type[dtype]:
+        return self._dtype
+
+    def forward(self, x: Tensor) -> Tensor:
+        return f.qlinear(x, self.weight, self.scale, self.bias)
+
     def to(self, dtype: Type[types.dtype]) -> Module:
         mod = super().to(dtype)
+        mod._bias = mod._parameters.get("_bias")
+        mod._scale = self.scale.to(dtype)
         mod._dtype = dtype
         return mod
 
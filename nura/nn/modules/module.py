@@ -77,7 +77,7 @@ class Module:
     def __setattr__(self, name, value):
         if isinstance(value, Module):
             self._modules[name] = value
-        if isinstance(value, Parameter):
+        elif isinstance(value, Parameter):
             self._parameters[name] = value
         self.__dict__[name] = value
 
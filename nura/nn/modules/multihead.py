@@ -34,7 +34,9 @@ class MultiHeadAttention(Module):
         self._kweight = Linear(dm, heads * dk, bias=bias, init=init, dtype=dtype)
         self._vweight = Linear(dm, heads * dv, bias=bias, init=init, dtype=dtype)
         self._oweight = Linear(heads * dv, dm, bias=bias, init=init, dtype=dtype)
-        self._attn = ScaledDotProductAttention(maskfill=maskfill, dropout=dropout)
+        self._attn = ScaledDotProductAttention(
+            maskfill=maskfill, dropout=dropout, scale=1 / (dk**0.5)
+        )
 
     @property
     def dm(self) -> int:
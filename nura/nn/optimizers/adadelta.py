@@ -18,8 +18,8 @@ class AdaDelta(Optimizer):
         super().__init__(parameters, 0.0, decay)
         self._gamma = gamma
         self._eps = eps
-        self._deltas = {}
-        self._squares = {}
+        self._deltas = {p: nura.zeroslike(p) for p in self._parameters}
+        self._squares = {p: nura.zeroslike(p) for p in self._parameters}
 
     @property
     def gamma(self) -> float:
@@ -35,26 +35,21 @@ class AdaDelta(Optimizer):
     def squares(self) -> Iterator[Tuple[Parameter, Tensor]]:
         yield from self._squares.items()
 
-    def step(self) -> None:
-        super().step()
-        for p in self._parameters:
-            if p.grad is None or not p.usegrad:
-                continue
-
-            d = self._deltas.get(p, nura.zeroslike(p))
-            s = self._squares.get(p, nura.zeroslike(p))
-            u, d_, s_ = adadelta(
-                parameter=p,
-                delta=d,
-                square=s,
-                decay=self.decay,
-                eps=self.eps,
-                graph=False,
-            )
+    def stepparameter(self, parameter: Parameter) -> None:
+        d = self._deltas[parameter]
+        s = self._squares[parameter]
+        u, d_, s_ = adadelta(
+            parameter=parameter,
+            delta=d,
+            square=s,
+            decay=self.decay,
+            eps=self.eps,
+            graph=False,
+        )
 
-            self._deltas[p] = d_
-            self._squares[p] = s_
-            self.update(p, u)
+        self._deltas[parameter] = d_
+        self._squares[parameter] = s_
+        self.update(parameter, u)
 
     def __repr__(self) -> str:
         gamma, eps, decay = self.gamma, self.eps, self.decay
@@ -17,7 +17,7 @@ class AdaGrad(Optimizer):
     ) -> None:
         super().__init__(parameters, learnrate, decay)
         self._eps = eps
-        self._squares = {}
+        self._squares = {p: nura.zeroslike(p) for p in self._parameters}
 
     @property
     def eps(self) -> float:
@@ -26,23 +26,18 @@ class AdaGrad(Optimizer):
     def squares(self) -> Iterator[Tuple[Parameter, Tensor]]:
         yield from self._squares.items()
 
-    def step(self) -> None:
-        super().step()
-        for p in self._parameters:
-            if p.grad is None or not p.usegrad:
-                continue
-
-            s = self._squares.get(p, nura.zeroslike(p))
-            u, s_ = adagrad(
-                parameter=p,
-                squaregrads=s,
-                learnrate=self.learnrate,
-                decay=self.decay,
-                eps=self.eps,
-                graph=False,
-            )
-            self._squares[p] = s_
-            self.update(p, u)
+    def stepparameter(self, parameter: Parameter) -> None:
+        s = self._squares[parameter]
+        u, s_ = adagrad(
+            parameter=parameter,
+            squaregrads=s,
+            learnrate=self.learnrate,
+            decay=self.decay,
+            eps=self.eps,
+            graph=False,
+        )
+        self._squares[parameter] = s_
+        self.update(parameter, u)
 
     def __repr__(self) -> str:
         learnrate, eps, decay = self.learnrate, self.eps, self.decay
@@ -19,7 +19,9 @@ class Adam(Optimizer):
         super().__init__(parameters, learnrate, decay)
         self._betas = betas
         self._eps = eps
-        self._moments = {}
+        self._moments = {
+            p: (nura.zeroslike(p), nura.zeroslike(p)) for p in self._parameters
+        }
 
     @property
     def betas(self) -> Tuple[float, float]:
@@ -32,24 +34,20 @@ class Adam(Optimizer):
     def moments(self) -> Iterator[Tuple[Tensor, Tuple[Tensor, Tensor]]]:
         yield from self._moments.items()
 
-    def step(self) -> None:
-        super().step()
-        for p in self._parameters:
-            if p.grad is None or not p.usegrad:
-                continue
-            vs = self._moments.get(p, (nura.zeroslike(p), nura.zeroslike(p)))
-            g, vs = adam(
-                parameter=p,
-                velocities=vs,
-                learnrate=self.learnrate,
-                timestep=self.stepnum,
-                betas=self.betas,
-                decay=self.decay,
-                eps=self.eps,
-                graph=False,
-            )
-            self._moments[p] = vs
-            self.update(p, g)
+    def stepparameter(self, parameter: Parameter) -> None:
+        vs = self._moments[parameter]
+        g, vs = adam(
+            parameter=parameter,
+            velocities=vs,
+            learnrate=self.learnrate,
+            timestep=self.stepnum,
+            betas=self.betas,
+            decay=self.decay,
+            eps=self.eps,
+            graph=False,
+        )
+        self._moments[parameter] = vs
+        self.update(parameter, g)
 
     def __repr__(self) -> str:
         learnrate, betas, eps, decay = self.learnrate, self.betas, self.eps, self.decay
@@ -1,7 +1,7 @@
 import nura
 from nura.tensors import Tensor
 from nura.nn.parameter import Parameter
-from typing import Iterator, Optional
+from typing import Iterator, Optional, Set
 
 
 class Optimizer:
@@ -16,6 +16,7 @@ class Optimizer:
         self._parameters = tuple(parameters)
         self._learnrate = learnrate
         self._decay = decay
+        self._hooked: Set[Parameter] = set()
 
     @property
     def learnrate(self) -> float:
@@ -43,6 +44,31 @@ class Optimizer:
 
     def step(self) -> None:
         self._stepnum += 1
+        for p in self._parameters:
+            if p.grad is None or not p.usegrad:
+                continue
+            self.stepparameter(p)
+
+    def stepparameter(self, parameter: Parameter) -> None:
+        raise NotImplementedError
+
+    def hook(self) -> None:
+        for p in self._parameters:
+            p.hook(self._hookstep)
+
+    def unhook(self) -> None:
+        for p in self._parameters:
+            p.unhook()
+        self._hooked.clear()
+
+    def _hookstep(self, parameter: Tensor) -> None:
+        if parameter in self._hooked:
+            self._hooked.clear()
+        if not self._hooked:
+            self._stepnum += 1
+        self._hooked.add(parameter)
+        if parameter.usegrad:
+            self.stepparameter(parameter)
 
     def __repr__(self) -> str:
         learnrate, decay = self.learnrate, self.decay
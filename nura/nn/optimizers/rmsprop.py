@@ -19,7 +19,7 @@ class RMSProp(Optimizer):
         super().__init__(parameters, learnrate, decay)
         self._alpha = alpha
         self._eps = eps
-        self._moments = {}
+        self._moments = {p: nura.zeroslike(p) for p in self._parameters}
 
     @property
     def alpha(self) -> float:
@@ -32,23 +32,19 @@ class RMSProp(Optimizer):
     def moments(self) -> Iterator[Tuple[Tensor, Tensor]]:
         yield from self._moments.items()
 
-    def step(self) -> None:
-        super().step()
-        for p in self._parameters:
-            if p.grad is None or not p.usegrad:
-                continue
-            v = self._moments.get(p, nura.zeroslike(p))
-            g, v_ = rmsprop(
-                parameter=p,
-                velocity=v,
-                learnrate=self.learnrate,
-                alpha=self.alpha,
-                decay=self.decay,
-                eps=self.eps,
-                graph=False,
-            )
-            self._moments[p] = v_
-            self.update(p, g)
+    def stepparameter(self, parameter: Parameter) -> None:
+        v = self._moments[parameter]
+        g, v_ = rmsprop(
+            parameter=parameter,
+            velocity=v,
+            learnrate=self.learnrate,
+            alpha=self.alpha,
+            decay=self.decay,
+            eps=self.eps,
+            graph=False,
+        )
+        self._moments[parameter] = v_
+        self.update(parameter, g)
 
     def __repr__(self) -> str:
         learnrate, alpha, eps, decay = self.learnrate, self.alpha, self.eps, self.decay
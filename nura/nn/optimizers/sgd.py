@@ -1,9 +1,10 @@
 import nura
+import numpy as np
 import nura.nn.utils as utils
 from nura.nn.optimizers.optimizer import Optimizer
 from nura.nn.parameter import Parameter
 from nura.tensors import Tensor
-from typing import Optional, Iterator, Tuple
+from typing import Optional, Iterator, Tuple, List
 
 
 class SGD(Optimizer):
@@ -20,6 +21,7 @@ class SGD(Optimizer):
         self._momentum = momentum
         self._nesterov = nesterov
         self._moments = {}
+        self._buckets = self.bucket()
 
     @property
     def momentum(self) -> float:
@@ -33,23 +35,68 @@ class SGD(Optimizer):
     def moments(self) -> Iterator[Tuple[Parameter, Tensor]]:
         yield from self._moments.items()
 
+    def stepparameter(self, parameter: Parameter) -> None:
+        if parameter.grad is None:
+            raise ValueError("Cannot compute update gradient, parameter.grad is None")
+        learnrate, momentum = self._learnrate, self._momentum
+        nesterov, decay = self._nesterov, self._decay
+        v = self._moments[parameter]
+        velocity = v.data
+        grad = parameter.grad.data * learnrate
+        if decay is not None:
+            grad += parameter.data * (decay * learnrate)
+        if nesterov:
+            grad += velocity * (momentum * learnrate)
+        velocity *= momentum
+        velocity += grad
+        self.update(parameter, v)
+
     def step(self) -> None:
-        super().step()
-        for p in self._parameters:
-            if p.grad is None or not p.usegrad:
+        self._stepnum += 1
+        stepbucket, stepparameter = self.stepbucket, self.stepparameter
+        for params in self._buckets:
+            if len(params) > 1 and all(
+                p.grad is not None and p.usegrad for p in params
+            ):
+                stepbucket(params)
+                continue
+            for p in params:
+                if p.grad is None or not p.usegrad:
+                    continue
+                stepparameter(p)
+
+    def bucket(self) -> List[Tuple[Parameter, ...]]:
+        groups = {}
+        for p in dict.fromkeys(self._parameters):
+            key = (p.dim, p.data.dtype) if p.ndim else p
+            groups.setdefault(key, []).append(p)
+        buckets = []
+        for params in groups.values():
+            if len(params) == 1:
+                self._moments[params[0]] = nura.zeroslike(params[0])
+                buckets.append(tuple(params))
                 continue
-            v = self._moments.get(p, nura.zeroslike(p))
-            g = sgd(
-                parameter=p,
-                velocity=v,
-                learnrate=self.learnrate,
-                momentum=self.momentum,
-                nesterov=self.nesterov,
-                decay=self.decay,
-                graph=False,
-            )
-            self._moments[p] = g
-            self.update(p, g)
+            first = params[0]
+            velocity = np.zeros((len(params),) + first.dim, dtype=first.data.dtype)
+            for v, p in zip(velocity, params):
+                self._moments[p] = nura.tensor(v)
+            buckets.append(tuple(params))
+        return buckets
+
+    def stepbucket(self, params: Tuple[Parameter, ...]) -> None:
+        velocity = self._moments[params[0]].data.base
+        learnrate, momentum = self._learnrate, self._momentum
+        nesterov, decay = self._nesterov, self._decay
+        grad = np.stack([p.grad.data for p in params])
+        grad *= learnrate
+        if decay is not None:
+            grad += np.stack([p.data for p in params]) * (decay * learnrate)
+        if nesterov:
+            grad += velocity * (momentum * learnrate)
+        velocity *= momentum
+        velocity += grad
+        for p, v in zip(params, velocity):
+            np.subtract(p.data, v, out=p.data)
 
     def __repr__(self) -> str:
         learnrate, momentum = self.learnrate, self.momentum
@@ -8,6 +8,9 @@ from numpy import ndarray
 
 class Parameter(Tensor):
 
+    __slots__ = ()
+    __hash__ = object.__hash__
+
     def __init__(
         self,
         data: ndarray,
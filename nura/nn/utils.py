@@ -1,7 +1,8 @@
 import nura
+import numpy as np
 from nura.tensors import Tensor
 from nura.types import dtype
-from typing import Optional, Type
+from typing import Optional, Type, Tuple
 
 
 def computedecay(tensor: Tensor, grad: Tensor, decay: float) -> Tensor:
@@ -35,3 +36,11 @@ def he(
     tensor = dist * std
     tensor.usegrad = usegrad
     return tensor
+
+
+def quantize(a: Tensor) -> Tuple[Tensor, Tensor]:
+    data = a.data
+    scale = np.abs(data).max(axis=-1, keepdims=True) / 127
+    scale[scale == 0] = 1
+    qdata = np.round(data / scale).astype(np.int8)
+    return nura.tensor(qdata), nura.tensor(scale.squeeze(-1), dtype=a.dtype)
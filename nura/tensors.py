@@ -1,7 +1,17 @@
 import nura
 import nura.types as types
 from nura.types import Tensorlike, Scalar, dtype, dim, dimlike
-from typing import Optional, Iterable, Type, Any, Union, List, Self, TYPE_CHECKING
+from typing import (
+    Optional,
+    Iterable,
+    Type,
+    Any,
+    Union,
+    List,
+    Callable,
+    Self,
+    TYPE_CHECKING,
+)
 from numpy import ndarray
 
 if TYPE_CHECKING:
@@ -10,6 +20,16 @@ if TYPE_CHECKING:
 
 class Tensor:
 
+    __slots__ = (
+        "_data",
+        "_grad",
+        "_gradfn",
+        "_usegrad",
+        "_leaf",
+        "_version",
+        "_accumhook",
+    )
+
     def __init__(
         self,
         data: ndarray,
@@ -24,6 +44,7 @@ class Tensor:
         self._usegrad: bool = usegrad
         self._leaf: bool = leaf
         self._version: int = 0
+        self._accumhook: Optional[Callable[["Tensor"], None]] = None
 
     @property
     def data(self) -> ndarray:
@@ -61,6 +82,10 @@ class Tensor:
     def version(self) -> int:
         return self._version
 
+    @property
+    def accumhook(self) -> Optional[Callable[["Tensor"], None]]:
+        return self._accumhook
+
     @property
     def dtype(self) -> Type[dtype]:
         return types.dtypeof(self.data)
@@ -71,6 +96,10 @@ class Tensor:
 
     @property
     def T(self) -> "Tensor":
+        if self.ndim < 2 and not self.usegrad:
+            return nura.tensor(self.data)
+        if self.ndim == 2:
+            return nura.transpose(self, 0, 1)
         dim = tuple(reversed(range(self.ndim)))
         return self.permute(dim)
 
@@ -136,6 +165,12 @@ class Tensor:
             raise ValueError("Tensor has no gradient function to unretain gradient")
         self.gradfn.unretain()
 
+    def hook(self, hook: Callable[["Tensor"], None]) -> None:
+        self._accumhook = hook
+
+    def unhook(self) -> None:
+        self._accumhook = None
+
     def attach(self) -> "Tensor":
         cls = type(self)
         return cls(self.data, True, None, None, True)
@@ -394,35 +429,6 @@ class Tensor:
     def bool(self) -> "Tensor":
         return self.to(types.bool)
 
-    def __setattr__(self, name: str, value: Any) -> None:
-        if name not in set(
-            (
-                "data",
-                "usegrad",
-                "dim",
-                "dtype",
-                "_data",
-                "_usegrad",
-                "_grad",
-                "_gradfn",
-                "_leaf",
-                "_version",
-            )
-        ):
-            raise AttributeError(
-                f"Cannot assign value of type {type(value)} to {name} of {nura.typename(self)}"
-            )
-        if name == "data":
-            self.__class__.data.__set__(self, value)
-        elif name == "usegrad":
-            self.__class__.usegrad.__set__(self, value)
-        elif name == "dim":
-            self.__class__.dim.__set__(self, value)
-        elif name == "dtype":
-            self.__class__.dtype.__set__(self, value)
-        else:
-            self.__dict__[name] = value
-
     def __getitem__(
         self,
         slice_: Union[
@@ -463,9 +469,12 @@ def tensor(
     dtype: Optional[Type[dtype]] = None,
 ) -> Tensor:
     if isinstance(data, Tensor):
-        dtype = data.dtype
-        data = data.data.copy()
+        if dtype is None or dtype is data.dtype:
+            return Tensor(data.data.copy(), usegrad, None, None, True)
+        data = data.data
     if dtype is None:
         dtype = nura.dtypeof(data)
+        if isinstance(data, ndarray):
+            return Tensor(data, usegrad, None, None, True)
     data = dtype.numpy(data)
     return Tensor(data, usegrad, None, None, True)
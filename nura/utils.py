@@ -345,9 +345,9 @@ def to(a: Tensor, dtype: Type[dtype]) -> Tensor:
 
 
 def tocontiguous(a: Tensor) -> Tensor:
-    c = a.clone()
-    data = np.ascontiguousarray(c.data)
-    return c.mutated(data=data)
+    if a.data.flags.c_contiguous:
+        return a
+    return a.clone()
 
 
 def todim(dim: Tuple[Any, ...]) -> dim:
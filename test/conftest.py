@@ -0,0 +1,51 @@
+import nura
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def reversemode():
+    with nura.usegrad():
+        yield
+
+
+@pytest.fixture(scope="session")
+def rand_pool():
+    pool = {}
+
+    def get(dim, key=0):
+        if (dim, key) not in pool:
+            rng = np.random.default_rng((key, *dim))
+            pool[dim, key] = rng.random(dim, dtype=np.float32)
+        return pool[dim, key].copy()
+
+    return get
+
+
+@pytest.fixture(scope="module")
+def tensor_pool(rand_pool):
+    pool = {}
+
+    def get(dim, key=0):
+        if (dim, key) not in pool:
+            pool[dim, key] = nura.tensor(rand_pool(dim, key), usegrad=True)
+        a = pool[dim, key]
+        if a.grad is not None:
+            a.grad.data.fill(0)
+        return a
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def ones_for():
+    pool = {}
+
+    def get(a):
+        key = (a.dim, a.dtype)
+        if key not in pool:
+            ones = np.ones((), dtype=a.data.dtype)
+            pool[key] = nura.tensor(np.broadcast_to(ones, a.dim))
+        return pool[key]
+
+    return get
@@ -0,0 +1,247 @@
+import nura
+import nura.nn as nn
+import numpy as np
+import nura.autograd.functional as functional
+import nura.autograd.rematerialize as rematerialize
+from nura.autograd.functional import jacrev
+
+
+def test_backward_accumulate_hook():
+    a = nura.randn(3, 4, usegrad=True)
+    b = nura.randn(4, usegrad=True)
+    grads = {}
+
+    def hook(tensor):
+        grads[tensor] = tensor.grad.data.copy()
+
+    a.hook(hook)
+    result_tensor = (a * b).sum()
+    result_tensor.backward()
+
+    assert a.grad is None
+    assert b.grad is not None
+    np.testing.assert_allclose(grads[a], np.broadcast_to(b.data, a.dim))
+
+
+def test_optimizer_hook_step():
+    x = nura.randn(8, 4)
+    model = nn.Linear(4, 2)
+    reference = nn.Linear(4, 2)
+    reference.weight.data = model.weight.data.copy()
+    reference.bias.data = model.bias.data.copy()
+
+    optimizer = nn.SGD(model.parameters(), learnrate=0.1)
+    optimizer.hook()
+    model(x).sum().backward()
+
+    refoptimizer = nn.SGD(reference.parameters(), learnrate=0.1)
+    reference(x).sum().backward()
+    refoptimizer.step()
+
+    assert optimizer.stepnum == refoptimizer.stepnum == 1
+    assert all(p.grad is None for p in model.parameters())
+    np.testing.assert_allclose(model.weight.data, reference.weight.data, rtol=1e-6)
+    np.testing.assert_allclose(model.bias.data, reference.bias.data, rtol=1e-6)
+
+
+def test_sgd_bucketed_step():
+    x = nura.randn(8, 4)
+    layers = [nn.Linear(4, 4), nn.Linear(4, 4)]
+    references = [nn.Linear(4, 4), nn.Linear(4, 4)]
+    parameters = [p for layer in layers for p in layer.parameters()]
+    refparameters = [p for layer in references for p in layer.parameters()]
+    for p, r in zip(parameters, refparameters):
+        r.data = p.data.copy()
+    arrays = [p.data for p in parameters]
+
+    optimizer = nn.SGD(parameters, learnrate=0.1, nesterov=True, decay=0.01)
+    refoptimizer = nn.SGD(refparameters, learnrate=0.1, nesterov=True, decay=0.01)
+    refoptimizer.hook()
+    for _ in range(2):
+        optimizer.zerograd()
+        layers[1](layers[0](x)).sum().backward()
+        optimizer.step()
+        references[1](references[0](x)).sum().backward()
+
+    for p, r, a in zip(parameters, refparameters, arrays):
+        assert p.data is a
+        np.testing.assert_allclose(p.data, r.data, rtol=1e-5, atol=1e-6)
+
+
+def test_optimizer_built_between_forward_and_backward():
+    x = nura.randn(8, 3)
+    layers = [nn.Linear(3, 3), nn.Linear(3, 3)]
+    parameters = [p for layer in layers for p in layer.parameters()]
+    for optimizer in (nn.SGD, nn.Adam):
+        loss = layers[1](layers[0](x)).sum()
+        versions = [p.version for p in parameters]
+        arrays = [p.data for p in parameters]
+        built = optimizer(parameters, learnrate=0.1)
+
+        assert [p.version for p in parameters] == versions
+        loss.backward()
+        built.step()
+        built.zerograd()
+        assert all(p.data is a for p, a in zip(parameters, arrays))
+
+
+def test_jacrev_batched_matmul():
+    a = nura.randn(3, 4, dtype=nura.double)
+    b = nura.randn(4, 2, dtype=nura.double)
+
+    def func(a, b):
+        return nura.sin(a @ b) * 2.0
+
+    output, jac = jacrev((a, b), func, pos=1)
+    expected = np.einsum(
+        "ij,ik,jl->ijkl",
+        2 * np.cos(a.data @ b.data),
+        a.data,
+        np.eye(2),
+    )
+    np.testing.assert_allclose(output.data, 2 * np.sin(a.data @ b.data))
+    np.testing.assert_allclose(jac.data, expected, rtol=1e-7, atol=1e-10)
+
+
+def test_jacrev_broadcast_fallback():
+    a = nura.randn(3, 4, dtype=nura.double)
+    b = nura.randn(4, dtype=nura.double)
+
+    def batched(a, b):
+        return nura.exp(a) * b
+
+    def unbatched(a, b):
+        return (nura.exp(a) * b).sum(-1)
+
+    _, jac = jacrev((a, b), batched, pos=1)
+    expected = np.einsum("ij,jk->ijk", np.exp(a.data), np.eye(4))
+    np.testing.assert_allclose(jac.data, expected, rtol=1e-7, atol=1e-10)
+
+    _, jac = jacrev((a, b), unbatched, pos=1)
+    np.testing.assert_allclose(jac.data, np.exp(a.data), rtol=1e-7, atol=1e-10)
+
+
+def test_autograd_recorder_follows_mode():
+    a = nura.randn(3, usegrad=True)
+    assert nura.Autograd.recorder() is nura.graph.addtograph
+
+    with nura.nograd():
+        assert nura.Autograd.recorder() is None
+        b = a * 2.0
+        with nura.forwardmode():
+            assert nura.Autograd.recorder() is nura.forwardad.primalify
+        assert nura.Autograd.recorder() is None
+
+    assert b.gradfn is None
+    assert nura.Autograd.recorder() is nura.graph.addtograph
+
+
+def test_jacrev_single_forward():
+    a = nura.randn(3, 4, dtype=nura.double)
+    calls = []
+
+    def func(a):
+        calls.append(a)
+        return a.sum(-1)
+
+    _, jac = jacrev(a, func)
+    expected = np.broadcast_to(np.eye(3)[:, :, None], (3, 3, 4))
+    assert len(calls) == 1
+    np.testing.assert_allclose(jac.data, expected)
+
+
+def test_backward_pooled_buffers_repeat():
+    a = nura.randn(3, 4, usegrad=True, dtype=nura.double)
+    b = nura.randn(4, usegrad=True, dtype=nura.double)
+    expected_a = 2 * np.cos(a.data + b.data)
+    expected_b = expected_a.sum(axis=0)
+
+    for _ in range(3):
+        c = a + b
+        (nura.sin(c) + nura.sin(c)).sum().backward()
+        np.testing.assert_allclose(a.grad.data, expected_a)
+        np.testing.assert_allclose(b.grad.data, expected_b)
+        a.cleargrad()
+        b.cleargrad()
+
+
+def test_backward_pool_bounded(monkeypatch):
+    a = nura.randn(3, 4, usegrad=True, dtype=nura.double)
+    b = nura.randn(3, 4, usegrad=True, dtype=nura.double)
+    nura.clearpool()
+
+    c = a * b
+    (nura.sin(c) + nura.cos(c)).sum().backward()
+    assert functional._pool.nbytes > 0
+
+    nura.clearpool()
+    assert functional._pool.nbytes == 0
+    assert not functional._pool.buffers
+
+    monkeypatch.setattr(functional, "_poolbytes", 0)
+    c = a * b
+    (nura.sin(c) + nura.cos(c)).sum().backward()
+    assert functional._pool.nbytes == 0
+
+
+def test_backward_leaf_grad_owns_buffer():
+    a = nura.randn(3, 4, usegrad=True)
+    b = nura.randn(3, 4, usegrad=True)
+
+    (a * 2.0).sum().backward()
+    expected_a = a.grad.data.copy()
+    (b * 3.0).sum().backward()
+    np.testing.assert_allclose(a.grad.data, expected_a)
+
+    (a * 2.0).sum().backward()
+    np.testing.assert_allclose(a.grad.data, 2 * expected_a)
+
+
+def test_backward_accumtype():
+    a = nura.randn(3, 4, usegrad=True, dtype=nura.half)
+    b = nura.randn(4, usegrad=True, dtype=nura.half)
+
+    with nura.accumtype(nura.float):
+        (a * b).sum().backward()
+        (a * b).sum().backward()
+
+    assert a.grad.dtype is nura.float
+    assert b.grad.dtype is nura.float
+    np.testing.assert_allclose(
+        a.grad.data, 2 * np.broadcast_to(b.data, a.dim).astype(np.float32)
+    )
+    assert nura.Autograd.accumtype() is None
+
+
+def test_rematerialize_backward():
+    x = nura.randn(4, 8, usegrad=True, dtype=nura.double)
+    gamma = nura.randn(8, usegrad=True, dtype=nura.double)
+    beta = nura.randn(8, usegrad=True, dtype=nura.double)
+
+    def func():
+        return nn.functional.gelu(nn.functional.layernorm(x, gamma, beta)).sum()
+
+    func().backward()
+    expected = [t.grad.data.copy() for t in (x, gamma, beta)]
+    for t in (x, gamma, beta):
+        t.cleargrad()
+
+    output = func()
+    assert len(rematerialize.plan(output)) == 2
+    assert rematerialize.rematerialize(output) > 0
+    assert not rematerialize.plan(output)
+    output.backward()
+
+    for t, grad in zip((x, gamma, beta), expected):
+        np.testing.assert_allclose(t.grad.data, grad)
+
+
+def test_rematerialize_skips_arguments():
+    x = nura.randn(4, 8, usegrad=True, dtype=nura.double)
+    y = nura.tensor(np.arange(4) % 8)
+    hidden = x * 2.0
+    output = nn.functional.crossentropy(hidden, y)
+
+    assert hidden.gradfn.context.arguments() == ((), {})
+    assert output.gradfn.context.arguments()[0][1] is y
+    assert rematerialize.savedbytes(output.gradfn) == x.data.nbytes
@@ -1733,6 +1733,15 @@ def test_transpose_higher_rank_tensor():
     np.testing.assert_allclose(result_tensor.data, expected, rtol=1e-8, atol=1e-8)
 
 
+
+def test_transpose_property_vector():
+    a = np.random.rand(4)
+    a_tensor = nura.tensor(a)
+    result_tensor = a_tensor.T
+    assert result_tensor is not a_tensor
+    assert np.shares_memory(result_tensor.data, a_tensor.data)
+    np.testing.assert_allclose(result_tensor.data, a, rtol=1e-8, atol=1e-8)
+
 def test_transpose_method():
     a = np.random.rand(3, 4, 5)
     a_tensor = nura.tensor(a)
@@ -2457,3 +2466,26 @@ def test_concat_higher_order_tensor():
     np.testing.assert_allclose(
         result_tensor.data, expected_result, rtol=1e-7, atol=1e-7
     )
+
+
+def test_maskedfill_tensor_broadcast_mask():
+    a = np.random.rand(2, 3, 4)
+    mask = np.random.choice([True, False], size=(3, 4))
+    a_tensor = nura.tensor(a)
+    mask_tensor = nura.tensor(mask)
+    result_tensor = f.maskedfill(a_tensor, mask_tensor, -1.0)
+    expected_result = np.where(mask, -1.0, a)
+    np.testing.assert_allclose(
+        result_tensor.data, expected_result, rtol=1e-7, atol=1e-7
+    )
+
+
+def test_tocontiguous():
+    a = np.random.rand(3, 4)
+    a_tensor = nura.tensor(a)
+    assert a_tensor.contiguous() is a_tensor
+
+    result_tensor = a_tensor.T.contiguous()
+    assert result_tensor.data.flags.c_contiguous
+    assert not np.shares_memory(result_tensor.data, a_tensor.data)
+    np.testing.assert_allclose(result_tensor.data, a.T, rtol=1e-8, atol=1e-8)
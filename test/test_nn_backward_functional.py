@@ -1,6 +1,7 @@
 import numpy as np
 import nura
 import nura.nn.functional as f
+import nura.nn.utils as utils
 
 
 def test_sigmoid_backward_scalar():
@@ -8,76 +9,76 @@ def test_sigmoid_backward_scalar():
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.sigmoid(x_tensor)
     result_tensor.backward()
-    h = 1e-7
+    h = 1e-20
 
     def func(x):
         return 1 / (1 + np.exp(-x))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_sigmoid_backward_vector():
+def test_sigmoid_backward_vector(ones_for):
     x = np.random.rand(5)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.sigmoid(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return 1 / (1 + np.exp(-x))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_sigmoid_backward_matrix():
+def test_sigmoid_backward_matrix(ones_for):
     x = np.random.rand(3, 4)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.sigmoid(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return 1 / (1 + np.exp(-x))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_sigmoid_backward_tensor():
+def test_sigmoid_backward_tensor(ones_for):
     x = np.random.rand(2, 3, 4)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.sigmoid(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return 1 / (1 + np.exp(-x))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_sigmoid_backward_higher_order_tensor():
+def test_sigmoid_backward_higher_order_tensor(ones_for):
     x = np.random.rand(2, 3, 4, 5)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.sigmoid(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return 1 / (1 + np.exp(-x))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
@@ -88,76 +89,76 @@ def test_tanh_backward_scalar():
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.tanh(x_tensor)
     result_tensor.backward()
-    h = 1e-7
+    h = 1e-20
 
     def func(x):
         return np.tanh(x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_tanh_backward_vector():
+def test_tanh_backward_vector(ones_for):
     x = np.random.randn(5)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.tanh(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.tanh(x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_tanh_backward_matrix():
+def test_tanh_backward_matrix(ones_for):
     x = np.random.randn(3, 4)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.tanh(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.tanh(x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_tanh_backward_tensor():
+def test_tanh_backward_tensor(ones_for):
     x = np.random.randn(2, 3, 4)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.tanh(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.tanh(x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_tanh_backward_higher_order_tensor():
+def test_tanh_backward_higher_order_tensor(ones_for):
     x = np.random.randn(2, 3, 4, 5)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.tanh(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.tanh(x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
@@ -168,76 +169,76 @@ def test_relu_backward_scalar():
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.relu(x_tensor)
     result_tensor.backward()
-    h = 1e-7
+    h = 1e-20
 
     def func(x):
         return np.maximum(0, x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_relu_backward_vector():
+def test_relu_backward_vector(ones_for):
     x = np.random.randn(6)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.relu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.maximum(0, x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_relu_backward_matrix():
+def test_relu_backward_matrix(ones_for):
     x = np.random.randn(4, 5)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.relu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.maximum(0, x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_relu_backward_tensor():
+def test_relu_backward_tensor(ones_for):
     x = np.random.randn(3, 4, 2)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.relu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.maximum(0, x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_relu_backward_higher_order_tensor():
+def test_relu_backward_higher_order_tensor(ones_for):
     x = np.random.randn(2, 3, 4, 5)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.relu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.maximum(0, x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
@@ -248,76 +249,76 @@ def test_relu6_backward_scalar():
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.relu6(x_tensor)
     result_tensor.backward()
-    h = 1e-7
+    h = 1e-20
 
     def func(x):
         return np.minimum(np.maximum(0, x), 6)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_relu6_backward_vector():
+def test_relu6_backward_vector(ones_for):
     x = np.random.randn(6) * 5
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.relu6(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.minimum(np.maximum(0, x), 6)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_relu6_backward_matrix():
+def test_relu6_backward_matrix(ones_for):
     x = np.random.randn(4, 3) * 5
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.relu6(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.minimum(np.maximum(0, x), 6)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_relu6_backward_tensor():
+def test_relu6_backward_tensor(ones_for):
     x = np.random.randn(3, 4, 2) * 5
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.relu6(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.minimum(np.maximum(0, x), 6)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_relu6_backward_higher_order_tensor():
+def test_relu6_backward_higher_order_tensor(ones_for):
     x = np.random.randn(2, 3, 4, 5) * 5
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.relu6(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.minimum(np.maximum(0, x), 6)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
@@ -328,110 +329,110 @@ def test_leakyrelu_backward_scalar():
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.leakyrelu(x_tensor)
     result_tensor.backward()
-    h = 1e-7
+    h = 1e-20
 
     def func(x):
         return np.maximum(0.01 * x, x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_leakyrelu_backward_vector():
+def test_leakyrelu_backward_vector(ones_for):
     x = np.random.randn(6)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.leakyrelu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.maximum(0.01 * x, x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_leakyrelu_backward_matrix():
+def test_leakyrelu_backward_matrix(ones_for):
     x = np.random.randn(4, 3)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.leakyrelu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.maximum(0.01 * x, x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_leakyrelu_backward_tensor():
+def test_leakyrelu_backward_tensor(ones_for):
     x = np.random.randn(3, 4, 2)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.leakyrelu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.maximum(0.01 * x, x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_leakyrelu_backward_higher_order_tensor():
+def test_leakyrelu_backward_higher_order_tensor(ones_for):
     x = np.random.randn(2, 3, 4, 5)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.leakyrelu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.maximum(0.01 * x, x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_leakyrelu_backward_custom_alpha():
+def test_leakyrelu_backward_custom_alpha(ones_for):
     x = np.random.randn(4, 3)
     alpha = 0.2
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.leakyrelu(x_tensor, alpha=alpha)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.maximum(alpha * x, x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_leakyrelu_backward_custom_alpha_high_order():
+def test_leakyrelu_backward_custom_alpha_high_order(ones_for):
     x = np.random.randn(2, 3, 4, 5)
     alpha = 0.05
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.leakyrelu(x_tensor, alpha=alpha)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.maximum(alpha * x, x)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
@@ -442,110 +443,110 @@ def test_elu_backward_scalar():
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.elu(x_tensor)
     result_tensor.backward()
-    h = 1e-7
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, np.exp(x) - 1)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_elu_backward_vector():
+def test_elu_backward_vector(ones_for):
     x = np.random.randn(6)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.elu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, np.exp(x) - 1)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_elu_backward_matrix():
+def test_elu_backward_matrix(ones_for):
     x = np.random.randn(4, 3)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.elu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, np.exp(x) - 1)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_elu_backward_tensor():
+def test_elu_backward_tensor(ones_for):
     x = np.random.randn(3, 4, 2)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.elu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, np.exp(x) - 1)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_elu_backward_higher_order_tensor():
+def test_elu_backward_higher_order_tensor(ones_for):
     x = np.random.randn(2, 3, 4, 5)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.elu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, np.exp(x) - 1)
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_elu_backward_custom_alpha():
+def test_elu_backward_custom_alpha(ones_for):
     x = np.random.randn(4, 3)
     alpha = 1.0
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.elu(x_tensor, alpha=alpha)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, alpha * (np.exp(x) - 1))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_elu_backward_custom_alpha_high_order():
+def test_elu_backward_custom_alpha_high_order(ones_for):
     x = np.random.randn(2, 3, 4, 5)
     alpha = 0.5
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.elu(x_tensor, alpha=alpha)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, alpha * (np.exp(x) - 1))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
@@ -556,76 +557,76 @@ def test_gelu_backward_scalar():
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.gelu(x_tensor)
     result_tensor.backward()
-    h = 1e-7
+    h = 1e-20
 
     def func(x):
         return 0.5 * x * (1 + np.tanh(np.sqrt(2 / np.pi) * (x + 0.044715 * x**3)))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_gelu_backward_vector():
+def test_gelu_backward_vector(ones_for):
     x = np.random.randn(6)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.gelu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return 0.5 * x * (1 + np.tanh(np.sqrt(2 / np.pi) * (x + 0.044715 * x**3)))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_gelu_backward_matrix():
+def test_gelu_backward_matrix(ones_for):
     x = np.random.randn(4, 3)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.gelu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return 0.5 * x * (1 + np.tanh(np.sqrt(2 / np.pi) * (x + 0.044715 * x**3)))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_gelu_backward_tensor():
+def test_gelu_backward_tensor(ones_for):
     x = np.random.randn(3, 4, 2)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.gelu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return 0.5 * x * (1 + np.tanh(np.sqrt(2 / np.pi) * (x + 0.044715 * x**3)))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_gelu_backward_higher_order_tensor():
+def test_gelu_backward_higher_order_tensor(ones_for):
     x = np.random.randn(2, 3, 4, 5)
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.gelu(x_tensor)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return 0.5 * x * (1 + np.tanh(np.sqrt(2 / np.pi) * (x + 0.044715 * x**3)))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
@@ -637,114 +638,327 @@ def test_celu_backward_scalar():
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.celu(x_tensor, alpha=alpha)
     result_tensor.backward()
-    h = 1e-7
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, alpha * (np.exp(x / alpha) - 1))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_celu_backward_vector():
+def test_celu_backward_vector(ones_for):
     x = np.random.randn(6)
     alpha = 1.0
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.celu(x_tensor, alpha=alpha)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, alpha * (np.exp(x / alpha) - 1))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_celu_backward_matrix():
+def test_celu_backward_matrix(ones_for):
     x = np.random.randn(4, 3)
     alpha = 1.0
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.celu(x_tensor, alpha=alpha)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, alpha * (np.exp(x / alpha) - 1))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_celu_backward_tensor():
+def test_celu_backward_tensor(ones_for):
     x = np.random.randn(3, 4, 2)
     alpha = 1.0
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.celu(x_tensor, alpha=alpha)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, alpha * (np.exp(x / alpha) - 1))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_celu_backward_higher_order_tensor():
+def test_celu_backward_higher_order_tensor(ones_for):
     x = np.random.randn(2, 3, 4, 5)
     alpha = 1.0
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.celu(x_tensor, alpha=alpha)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, alpha * (np.exp(x / alpha) - 1))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_celu_backward_custom_alpha():
+def test_celu_backward_custom_alpha(ones_for):
     x = np.random.randn(4, 3)
     alpha = 0.75
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.celu(x_tensor, alpha=alpha)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, alpha * (np.exp(x / alpha) - 1))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
 
 
-def test_celu_backward_custom_alpha_high_order():
+def test_celu_backward_custom_alpha_high_order(ones_for):
     x = np.random.randn(2, 3, 4, 5)
     alpha = 0.25
     x_tensor = nura.tensor(x, usegrad=True)
     result_tensor = f.celu(x_tensor, alpha=alpha)
-    result_tensor.backward(nura.oneslike(result_tensor))
-    h = 1e-7
+    result_tensor.backward(ones_for(result_tensor))
+    h = 1e-20
 
     def func(x):
         return np.where(x > 0, x, alpha * (np.exp(x / alpha) - 1))
 
-    expected_grad = (func(x + h) - func(x - h)) / (2 * h)
+    expected_grad = np.imag(func(x + 1j * h)) / h
+
+    assert x_tensor.grad is not None
+    np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
+
+
+def test_flashattention_backward():
+    q = np.random.rand(2, 5, 4)
+    k = np.random.rand(2, 7, 4)
+    v = np.random.rand(2, 7, 3)
+    grad = np.random.rand(2, 5, 3)
+    q_tensor = nura.tensor(q, usegrad=True)
+    k_tensor = nura.tensor(k, usegrad=True)
+    v_tensor = nura.tensor(v, usegrad=True)
+    context, _ = f.attention(q_tensor, k_tensor, v_tensor)
+    context.backward(nura.tensor(grad))
+    expected_grads = [t.grad.data for t in (q_tensor, k_tensor, v_tensor)]
+
+    q_tensor = nura.tensor(q, usegrad=True)
+    k_tensor = nura.tensor(k, usegrad=True)
+    v_tensor = nura.tensor(v, usegrad=True)
+    result_tensor = f.flashattention(q_tensor, k_tensor, v_tensor, blocksize=3)
+    result_tensor.backward(nura.tensor(grad))
+
+    for tensor, expected_grad in zip((q_tensor, k_tensor, v_tensor), expected_grads):
+        assert tensor.grad is not None
+        np.testing.assert_allclose(
+            tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7
+        )
+
+
+def test_attention_backward_with_mask():
+    q = np.random.rand(2, 5, 4)
+    k = np.random.rand(2, 7, 4)
+    v = np.random.rand(2, 7, 3)
+    mask = np.random.choice([True, False], size=(2, 5, 7))
+    mask[..., 0] = True
+    grad = np.random.rand(2, 5, 3)
+    q_tensor = nura.tensor(q, usegrad=True)
+    k_tensor = nura.tensor(k, usegrad=True)
+    v_tensor = nura.tensor(v, usegrad=True)
+    result_tensor = f.flashattention(
+        q_tensor, k_tensor, v_tensor, nura.tensor(mask), blocksize=3
+    )
+    result_tensor.backward(nura.tensor(grad))
+    expected_grads = [t.grad.data for t in (q_tensor, k_tensor, v_tensor)]
+
+    q_tensor = nura.tensor(q, usegrad=True)
+    k_tensor = nura.tensor(k, usegrad=True)
+    v_tensor = nura.tensor(v, usegrad=True)
+    context, _ = f.attention(q_tensor, k_tensor, v_tensor, nura.tensor(mask))
+    context.backward(nura.tensor(grad))
+
+    for tensor, expected_grad in zip((q_tensor, k_tensor, v_tensor), expected_grads):
+        assert tensor.grad is not None
+        np.testing.assert_allclose(
+            tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7
+        )
+
+
+def test_attention_weights_backward():
+    q = np.random.rand(2, 5, 4)
+    k = np.random.rand(2, 7, 4)
+    v = np.random.rand(2, 7, 3)
+    grad = np.random.rand(2, 5, 7)
+    q_tensor = nura.tensor(q, usegrad=True)
+    k_tensor = nura.tensor(k, usegrad=True)
+    simscore = nura.matmul(q_tensor, k_tensor.transpose(-1, -2)) * 0.5
+    f.softmax(simscore, -1).backward(nura.tensor(grad))
+    expected_grads = [t.grad.data for t in (q_tensor, k_tensor)]
+
+    q_tensor = nura.tensor(q, usegrad=True)
+    k_tensor = nura.tensor(k, usegrad=True)
+    _, weights = f.attention(q_tensor, k_tensor, nura.tensor(v))
+    assert weights.gradfn is not None
+    weights.backward(nura.tensor(grad))
+
+    for tensor, expected_grad in zip((q_tensor, k_tensor), expected_grads):
+        assert tensor.grad is not None
+        np.testing.assert_allclose(
+            tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7
+        )
+
+
+def test_softmax_backward_vector():
+    x = np.random.rand(5)
+    grad = np.random.rand(5)
+    x_tensor = nura.tensor(x, usegrad=True)
+    result_tensor = f.softmax(x_tensor)
+    result_tensor.backward(nura.tensor(grad))
+
+    p = np.exp(x) / np.exp(x).sum()
+    expected_grad = (np.diag(p) - np.outer(p, p)) @ grad
 
     assert x_tensor.grad is not None
     np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
+
+
+def test_softmax_backward_tensor_dim_1():
+    x = np.random.rand(2, 3, 4)
+    grad = np.random.rand(2, 3, 4)
+    x_tensor = nura.tensor(x, usegrad=True)
+    result_tensor = f.softmax(x_tensor, dim=1)
+    result_tensor.backward(nura.tensor(grad))
+
+    p = np.exp(x) / np.exp(x).sum(axis=1, keepdims=True)
+    expected_grad = np.empty_like(x)
+    for i, j in np.ndindex(2, 4):
+        jac = np.diag(p[i, :, j]) - np.outer(p[i, :, j], p[i, :, j])
+        expected_grad[i, :, j] = jac @ grad[i, :, j]
+
+    assert x_tensor.grad is not None
+    np.testing.assert_allclose(x_tensor.grad.data, expected_grad, rtol=1e-7, atol=1e-7)
+
+
+def test_linear_backward_tensor():
+    x = np.random.rand(2, 3, 5)
+    w = np.random.rand(4, 5)
+    grad = np.random.rand(2, 3, 4)
+    x_tensor = nura.tensor(x, usegrad=True)
+    w_tensor = nura.tensor(w, usegrad=True)
+    result_tensor = f.linear(x_tensor, w_tensor)
+    result_tensor.backward(nura.tensor(grad))
+
+    expected_grad_x = np.matmul(grad, w)
+    expected_grad_w = np.einsum("abi,abj->ij", grad, x)
+
+    assert x_tensor.grad is not None
+    assert w_tensor.grad is not None
+    np.testing.assert_allclose(
+        x_tensor.grad.data, expected_grad_x, rtol=1e-7, atol=1e-7
+    )
+    np.testing.assert_allclose(
+        w_tensor.grad.data, expected_grad_w, rtol=1e-7, atol=1e-7
+    )
+
+
+def test_linear_backward_tensor_with_bias():
+    x = np.random.rand(2, 3, 5)
+    w = np.random.rand(4, 5)
+    b = np.random.rand(4)
+    grad = np.random.rand(2, 3, 4)
+    x_tensor = nura.tensor(x, usegrad=True)
+    w_tensor = nura.tensor(w, usegrad=True)
+    b_tensor = nura.tensor(b, usegrad=True)
+    result_tensor = f.linear(x_tensor, w_tensor, b_tensor)
+    result_tensor.backward(nura.tensor(grad))
+
+    expected_grad_x = np.matmul(grad, w)
+    expected_grad_w = np.einsum("abi,abj->ij", grad, x)
+    expected_grad_b = np.sum(grad, axis=(0, 1))
+
+    assert x_tensor.grad is not None
+    assert w_tensor.grad is not None
+    assert b_tensor.grad is not None
+    np.testing.assert_allclose(
+        x_tensor.grad.data, expected_grad_x, rtol=1e-7, atol=1e-7
+    )
+    np.testing.assert_allclose(
+        w_tensor.grad.data, expected_grad_w, rtol=1e-7, atol=1e-7
+    )
+    np.testing.assert_allclose(
+        b_tensor.grad.data, expected_grad_b, rtol=1e-7, atol=1e-7
+    )
+
+
+def test_qlinear_backward_tensor_with_bias():
+    x = np.random.rand(2, 3, 5)
+    w = np.random.randn(4, 5)
+    b = np.random.rand(4)
+    grad = np.random.rand(2, 3, 4)
+    qweight, scale = utils.quantize(nura.tensor(w, dtype=nura.double))
+    x_tensor = nura.tensor(x, usegrad=True)
+    b_tensor = nura.tensor(b, usegrad=True)
+    result_tensor = f.qlinear(x_tensor, qweight, scale, b_tensor)
+    result_tensor.backward(nura.tensor(grad))
+
+    dequantized = qweight.data * scale.data[:, None]
+    expected_result = np.matmul(x, dequantized.T) + b
+    expected_grad_x = np.matmul(grad, dequantized)
+    expected_grad_b = np.sum(grad, axis=(0, 1))
+
+    assert x_tensor.grad is not None
+    assert b_tensor.grad is not None
+    assert np.abs(dequantized - w).max() <= scale.data.max()
+    np.testing.assert_allclose(
+        result_tensor.data, expected_result, rtol=1e-7, atol=1e-7
+    )
+    np.testing.assert_allclose(
+        x_tensor.grad.data, expected_grad_x, rtol=1e-7, atol=1e-7
+    )
+    np.testing.assert_allclose(
+        b_tensor.grad.data, expected_grad_b, rtol=1e-7, atol=1e-7
+    )
+
+
+def test_quantized_linear_module():
+    linear = nura.nn.Linear(5, 4, dtype=nura.double)
+    weight, bias = linear.weight, linear.bias
+    x = np.random.rand(2, 5)
+    quantized = linear.quantize()
+
+    assert linear.weight is weight and linear.bias is bias
+    assert tuple(map(id, linear.parameters())) == (id(weight), id(bias))
+    assert tuple(map(id, quantized.parameters())) == (id(quantized.bias),)
+    assert quantized.bias is not bias
+    assert quantized.weight.data.dtype == np.int8
+
+    result_tensor = quantized(nura.tensor(x))
+    expected_result = f.qlinear(nura.tensor(x), quantized.weight, quantized.scale, bias)
+    np.testing.assert_allclose(result_tensor.data, expected_result.data)
+
+    converted = quantized.float()
+    assert tuple(map(id, converted.parameters())) == (id(converted.bias),)
+    assert converted.bias.dtype is converted.scale.dtype is nura.float
+    assert quantized.bias.dtype is nura.double
+    assert repr(converted)
@@ -1010,6 +1010,53 @@ def test_attention_with_dropout_different_lengths():
     assert np.any(weights.data == 0)
 
 
+def test_flashattention_blocks():
+    q = np.random.rand(2, 5, 4)
+    k = np.random.rand(2, 7, 4)
+    v = np.random.rand(2, 7, 3)
+    q_tensor = nura.tensor(q)
+    k_tensor = nura.tensor(k)
+    v_tensor = nura.tensor(v)
+    context = f.flashattention(q_tensor, k_tensor, v_tensor, blocksize=3)
+
+    expected_context, _ = attention_reference(q, k, v)
+
+    np.testing.assert_allclose(context.data, expected_context, rtol=1e-7, atol=1e-7)
+
+
+def test_flashattention_with_mask():
+    q = np.random.rand(2, 5, 4)
+    k = np.random.rand(2, 7, 4)
+    v = np.random.rand(2, 7, 3)
+    mask = np.random.choice([True, False], size=(2, 5, 7))
+    mask[..., 0] = True
+    q_tensor = nura.tensor(q)
+    k_tensor = nura.tensor(k)
+    v_tensor = nura.tensor(v)
+    mask_tensor = nura.tensor(mask)
+    context = f.flashattention(q_tensor, k_tensor, v_tensor, mask_tensor, blocksize=2)
+
+    expected_context, _ = attention_reference(q, k, v, mask)
+
+    np.testing.assert_allclose(context.data, expected_context, rtol=1e-7, atol=1e-7)
+
+
+
+def test_flashattention_custom_scale():
+    q = np.random.rand(2, 5, 4)
+    k = np.random.rand(2, 7, 4)
+    v = np.random.rand(2, 7, 3)
+    q_tensor = nura.tensor(q)
+    k_tensor = nura.tensor(k)
+    v_tensor = nura.tensor(v)
+    context = f.flashattention(q_tensor, k_tensor, v_tensor, blocksize=3, scale=0.1)
+
+    expected_context, _ = f.attention(q_tensor, k_tensor, v_tensor, scale=0.1)
+
+    np.testing.assert_allclose(
+        context.data, expected_context.data, rtol=1e-7, atol=1e-7
+    )
+
 def test_embedding_vector():
     x = np.array([1, 2, 3])
     w = np.random.rand(5, 4)